@@ -0,0 +1,465 @@
+"""
+Local stand-ins for the AWS APIs used by the DR test scripts.
+
+The stand-ins implement just enough of the boto3 client interface for the
+script entry points to run unchanged. Every call goes through FakeClient._call,
+which:
+1. emits botocore's before-send and needs-retry events for each attempt on
+   an emitter wired up by drtest.aws_clients.instrument_events, so the rate
+   limiting, throttle detection and tracing handlers the real clients use
+   run unchanged
+2. sleeps for the configured per-call latency
+3. applies an optional server-side request rate limit, retrying throttled
+   calls with exponential backoff the way botocore's standard retry mode does
+4. counts API calls per service/operation
+
+Data is generated from the object index rather than stored, so buckets of
+millions of objects cost no memory until they are listed.
+"""
+
+import hashlib
+import os
+import sys
+import threading
+import time
+
+from botocore.exceptions import ClientError
+from botocore.hooks import HierarchicalEmitter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from drtest import aws_clients
+
+MAX_ATTEMPTS = 8
+
+
+class CallStats:
+    """Thread-safe API call counters shared by all stand-ins in a run"""
+
+    def __init__(self):
+        self.calls = {}
+        self.throttles = {}
+        self._lock = threading.Lock()
+
+    def record(self, service, operation, throttled=False):
+        key = f"{service}.{operation}"
+        with self._lock:
+            if throttled:
+                self.throttles[key] = self.throttles.get(key, 0) + 1
+            else:
+                self.calls[key] = self.calls.get(key, 0) + 1
+
+    def summary(self):
+        with self._lock:
+            return {
+                'total_calls': sum(self.calls.values()),
+                'total_throttles': sum(self.throttles.values()),
+                'calls': dict(sorted(self.calls.items())),
+                'throttles': dict(sorted(self.throttles.items()))
+            }
+
+
+class ServerRateLimit:
+    """Token bucket standing in for the service-side request quota"""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class FakeHttpResponse:
+    """The parts of botocore's AWSResponse the event handlers look at"""
+
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class FakeRequest:
+    """The parts of botocore's AWSPreparedRequest the event handlers look at"""
+
+    def __init__(self, headers=None):
+        self.headers = headers or {}
+
+
+class FakeClient:
+    """Base class providing latency, throttling and call accounting"""
+
+    service = None
+    throttle_code = 'ThrottlingException'
+    throttle_status = 400
+
+    def __init__(self, stats, latency=0.0, max_rps=None, region='us-east-1'):
+        self.stats = stats
+        self.latency = latency
+        self.region = region
+        self.events = HierarchicalEmitter()
+        aws_clients.instrument_events(self.events, region, self.service)
+        self._server_limits = {}
+        self._max_rps = max_rps
+        self._limits_lock = threading.Lock()
+
+    def _server_limit(self, operation):
+        if not self._max_rps:
+            return None
+        with self._limits_lock:
+            limit = self._server_limits.get(operation)
+            if limit is None:
+                limit = ServerRateLimit(self._max_rps)
+                self._server_limits[operation] = limit
+            return limit
+
+    def _throttle_error(self, operation):
+        # HEAD responses have no body, so botocore reports the status code as the error code
+        code = str(self.throttle_status) if operation.startswith('Head') else self.throttle_code
+        return {
+            'Error': {'Code': code, 'Message': 'Rate exceeded'},
+            'ResponseMetadata': {'HTTPStatusCode': self.throttle_status}
+        }
+
+    def _call(self, operation, handler):
+        server_limit = self._server_limit(operation)
+
+        for attempt in range(MAX_ATTEMPTS):
+            self.events.emit(f"before-send.{self.service}.{operation}", request=FakeRequest())
+            if self.latency:
+                time.sleep(self.latency)
+
+            if server_limit is not None and not server_limit.allow():
+                self.stats.record(self.service, operation, throttled=True)
+                error = self._throttle_error(operation)
+                self.events.emit(f"needs-retry.{self.service}.{operation}",
+                                 response=(FakeHttpResponse(self.throttle_status), error), attempts=attempt + 1)
+                if attempt == MAX_ATTEMPTS - 1:
+                    raise ClientError(error, operation)
+                time.sleep(min(20.0, 0.05 * (2 ** attempt)))
+                continue
+
+            self.stats.record(self.service, operation)
+            try:
+                result = handler()
+            except ClientError as e:
+                status = e.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+                if status is None:
+                    code = e.response['Error']['Code']
+                    status = int(code) if code.isdigit() else 400
+                self.events.emit(f"needs-retry.{self.service}.{operation}",
+                                 response=(FakeHttpResponse(status), e.response), attempts=attempt + 1)
+                raise
+            self.events.emit(f"needs-retry.{self.service}.{operation}",
+                             response=(FakeHttpResponse(200), {'ResponseMetadata': {'HTTPStatusCode': 200}}),
+                             attempts=attempt + 1)
+            return result
+
+
+def _etag(bucket_seed, index):
+    return hashlib.md5(f"{bucket_seed}:{index}".encode()).hexdigest()
+
+
+class FakeBucket:
+    """A bucket whose objects are derived from their index"""
+
+    def __init__(self, name, object_count, missing_every=0, mismatch_every=0):
+        self.name = name
+        self.object_count = object_count
+        self.missing_every = missing_every
+        self.mismatch_every = mismatch_every
+        self.copies = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(index):
+        return f"data/obj-{index:08d}"
+
+    @staticmethod
+    def index_for(key):
+        try:
+            return int(key.rsplit('-', 1)[-1])
+        except ValueError:
+            return None
+
+    def get(self, key):
+        with self._lock:
+            if key in self.copies:
+                return self.copies[key]
+
+        index = self.index_for(key)
+        if index is None or not 0 <= index < self.object_count:
+            return None
+        if self.missing_every and index % self.missing_every == 0:
+            return None
+
+        # Mismatched objects take their ETag from a different seed
+        seed = 'mismatch' if self.mismatch_every and index % self.mismatch_every == 1 else 'source'
+        return {'Key': key, 'Size': 1024 + index % 4096, 'ETag': f'"{_etag(seed, index)}"'}
+
+    def put(self, key, obj):
+        with self._lock:
+            self.copies[key] = dict(obj, Key=key)
+
+    def list_page(self, prefix, start, page_size):
+        """Return one page of objects and the index the next page starts at"""
+        end = min(self.object_count, start + page_size)
+        contents = []
+        for index in range(start, end):
+            obj = self.get(self.key_for(index))
+            if obj is not None and obj['Key'].startswith(prefix):
+                contents.append(obj)
+        return contents, (end if end < self.object_count else None)
+
+
+class FakePaginator:
+    def __init__(self, client, operation):
+        self.client = client
+        self.operation = operation
+
+    def paginate(self, **kwargs):
+        return self.client._paginate(self.operation, **kwargs)
+
+
+class FakeS3(FakeClient):
+    """S3 stand-in for list_objects_v2, head_object and copy_object"""
+
+    service = 's3'
+    throttle_code = 'SlowDown'
+    throttle_status = 503
+
+    def __init__(self, stats, buckets, **kwargs):
+        super().__init__(stats, **kwargs)
+        self.buckets = {bucket.name: bucket for bucket in buckets}
+
+    def get_paginator(self, operation):
+        return FakePaginator(self, operation)
+
+    def _paginate(self, operation, Bucket, Prefix='', MaxItems=None, PaginationConfig=None):
+        bucket = self.buckets[Bucket]
+        max_items = MaxItems or (PaginationConfig or {}).get('MaxItems')
+        start = 0
+        yielded = 0
+
+        while start is not None:
+            contents, start = self._call(
+                'ListObjectsV2', lambda: bucket.list_page(Prefix, start, 1000)
+            )
+            if max_items is not None:
+                contents = contents[:max_items - yielded]
+            yielded += len(contents)
+            page = {'KeyCount': len(contents), 'IsTruncated': start is not None}
+            if contents:
+                page['Contents'] = contents
+            yield page
+
+            if max_items is not None and yielded >= max_items:
+                return
+
+    def head_object(self, Bucket, Key):
+        def handler():
+            obj = self.buckets[Bucket].get(Key)
+            if obj is None:
+                raise ClientError({'Error': {'Code': '404', 'Message': 'Not Found'}}, 'HeadObject')
+            return {'ContentLength': obj['Size'], 'ETag': obj['ETag']}
+        return self._call('HeadObject', handler)
+
+    def copy_object(self, CopySource, Bucket, Key):
+        def handler():
+            source = self.buckets[CopySource['Bucket']].get(CopySource['Key'])
+            if source is None:
+                raise ClientError({'Error': {'Code': 'NoSuchKey', 'Message': 'Not Found'}}, 'CopyObject')
+            self.buckets[Bucket].put(Key, source)
+            return {'CopyObjectResult': {'ETag': source['ETag']}}
+        return self._call('CopyObject', handler)
+
+
+class FakeLogs(FakeClient):
+    """CloudWatch Logs stand-in keeping events in memory"""
+
+    service = 'cloudwatch-logs'
+
+    def __init__(self, stats, **kwargs):
+        super().__init__(stats, **kwargs)
+        self.groups = {}
+        self._lock = threading.Lock()
+
+    def _group(self, name):
+        if name not in self.groups:
+            raise ClientError({'Error': {'Code': 'ResourceNotFoundException', 'Message': name}}, 'Logs')
+        return self.groups[name]
+
+    def create_log_group(self, logGroupName):
+        def handler():
+            with self._lock:
+                self.groups.setdefault(logGroupName, {})
+            return {}
+        return self._call('CreateLogGroup', handler)
+
+    def create_log_stream(self, logGroupName, logStreamName):
+        def handler():
+            with self._lock:
+                streams = self._group(logGroupName)
+                if logStreamName in streams:
+                    raise ClientError(
+                        {'Error': {'Code': 'ResourceAlreadyExistsException', 'Message': logStreamName}},
+                        'CreateLogStream'
+                    )
+                streams[logStreamName] = []
+            return {}
+        return self._call('CreateLogStream', handler)
+
+    def describe_log_streams(self, logGroupName, logStreamNamePrefix=''):
+        def handler():
+            with self._lock:
+                streams = self._group(logGroupName)
+                return {'logStreams': [
+                    {'logStreamName': name} for name in sorted(streams) if name.startswith(logStreamNamePrefix)
+                ]}
+        return self._call('DescribeLogStreams', handler)
+
+    def put_log_events(self, logGroupName, logStreamName, logEvents, sequenceToken=None):
+        def handler():
+            with self._lock:
+                self._group(logGroupName)[logStreamName].extend(logEvents)
+            return {}
+        return self._call('PutLogEvents', handler)
+
+    def filter_log_events(self, logGroupName, logStreamNames, filterPattern, startTime, endTime):
+        needle = filterPattern.strip('"')
+
+        def handler():
+            with self._lock:
+                streams = self._group(logGroupName)
+                events = [
+                    event
+                    for name in logStreamNames
+                    for event in streams.get(name, [])
+                    if needle in event['message']
+                ]
+            return {'events': events}
+        return self._call('FilterLogEvents', handler)
+
+
+class FakeEC2(FakeClient):
+    service = 'ec2'
+    throttle_code = 'RequestLimitExceeded'
+
+    def __init__(self, stats, instance_count, env_name, **kwargs):
+        super().__init__(stats, **kwargs)
+        self.instance_count = instance_count
+        self.env_name = env_name
+
+    def describe_instances(self, Filters):
+        def handler():
+            return {'Reservations': [{'Instances': [
+                {'InstanceId': f"i-{index:017x}", 'State': {'Name': 'running'},
+                 'Tags': [{'Key': 'Environment', 'Value': self.env_name}]}
+                for index in range(self.instance_count)
+            ]}]}
+        return self._call('DescribeInstances', handler)
+
+
+class FakeRDS(FakeClient):
+    service = 'rds'
+
+    def __init__(self, stats, db_count, env_name, **kwargs):
+        super().__init__(stats, **kwargs)
+        self.db_count = db_count
+        self.env_name = env_name
+
+    def describe_db_instances(self):
+        def handler():
+            return {'DBInstances': [
+                {'DBInstanceIdentifier': f"db-{index}",
+                 # Every other database belongs to a different environment
+                 'TagList': [{'Key': 'Environment', 'Value': self.env_name if index % 2 == 0 else 'other'}]}
+                for index in range(self.db_count)
+            ]}
+        return self._call('DescribeDBInstances', handler)
+
+
+class FakeELBv2(FakeClient):
+    service = 'elastic-load-balancing-v2'
+
+    def __init__(self, stats, lb_count, env_name, **kwargs):
+        super().__init__(stats, **kwargs)
+        self.lb_count = lb_count
+        self.env_name = env_name
+
+    def _arn(self, index):
+        return f"arn:aws:elasticloadbalancing:{self.region}:123456789012:loadbalancer/app/lb-{index}/{index:016x}"
+
+    def describe_load_balancers(self):
+        def handler():
+            return {'LoadBalancers': [{'LoadBalancerArn': self._arn(index)} for index in range(self.lb_count)]}
+        return self._call('DescribeLoadBalancers', handler)
+
+    def describe_tags(self, ResourceArns):
+        def handler():
+            return {'TagDescriptions': [
+                {'ResourceArn': arn, 'Tags': [{'Key': 'Environment', 'Value': self.env_name}]}
+                for arn in ResourceArns
+            ]}
+        return self._call('DescribeTags', handler)
+
+
+class FakeCloudWatch(FakeClient):
+    service = 'cloudwatch'
+
+    def __init__(self, stats, **kwargs):
+        super().__init__(stats, **kwargs)
+        self.dashboards = {}
+        self.metric_data = []
+
+    def put_dashboard(self, DashboardName, DashboardBody):
+        def handler():
+            self.dashboards[DashboardName] = DashboardBody
+            return {'DashboardValidationMessages': []}
+        return self._call('PutDashboard', handler)
+
+    def put_metric_data(self, Namespace, MetricData):
+        def handler():
+            self.metric_data.append((Namespace, MetricData))
+            return {}
+        return self._call('PutMetricData', handler)
+
+
+class FakeClientFactory:
+    """Drop-in replacement for the drtest.aws_clients module"""
+
+    def __init__(self, clients):
+        self.clients = clients
+
+    def get_client(self, service, profile=None, region=None, max_workers=None):
+        return self.clients[service]
+
+
+class VirtualTime:
+    """
+    Replacement for a script's `time` module that skips sleeps.
+
+    Fixed waits such as the log aggregation delay would otherwise dominate
+    every run; they are recorded as simulated seconds instead.
+    """
+
+    def __init__(self):
+        self.simulated_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def sleep(self, seconds):
+        with self._lock:
+            self.simulated_seconds += seconds
+
+    def time(self):
+        return time.time() + self.simulated_seconds
+
+    def __getattr__(self, name):
+        return getattr(time, name)
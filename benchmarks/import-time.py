@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Cold Start Benchmark
+
+This script measures how long no-op drtest invocations (--help and argument
+errors, writing the sample log source config) take from process start to
+exit, and how much memory they use, compared with a process that only
+imports boto3. Each run is a fresh interpreter in an empty working
+directory, so nothing is cached between samples.
+
+It also checks that none of the no-op invocations imports botocore; a
+regression there usually means a module-level boto3 import crept back in.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts')
+
+# name: (arguments after the interpreter, should botocore be imported)
+INVOCATIONS = {
+    'import-boto3': (['-c', 'import boto3'], True),
+    'drtest --help': (['-m', 'drtest', '--help'], False),
+    's3-backup --help': (['-m', 'drtest', 's3-backup', '--help'], False),
+    'fis-steady-state --help': (['-m', 'drtest', 'fis-steady-state', '--help'], False),
+    'validate --help': (['-m', 'drtest', 'validate', '--help'], False),
+    'report-store --help': (['-m', 'drtest', 'report-store', '--help'], False),
+    'log-aggregation (bad args)': (['-m', 'drtest', 'log-aggregation', '--region'], False),
+    'log-aggregation (sample config)': (['-m', 'drtest', 'log-aggregation', '--config', 'log-sources.json'], False),
+}
+
+
+def run_once(args):
+    """Run one invocation and return (wall seconds, peak RSS in MB)"""
+    env = dict(os.environ, PYTHONPATH=SCRIPTS_DIR)
+    # A fresh directory so files written by one run (the sample config) are not read by the next
+    with tempfile.TemporaryDirectory() as cwd:
+        start = time.perf_counter()
+        process = subprocess.Popen([sys.executable] + args, cwd=cwd, env=env,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        _, _, rusage = os.wait4(process.pid, 0)
+        elapsed = time.perf_counter() - start
+    # ru_maxrss is in kilobytes on Linux
+    return elapsed, rusage.ru_maxrss / 1024
+
+
+def imports_botocore(args):
+    """Check -X importtime output for a botocore import"""
+    env = dict(os.environ, PYTHONPATH=SCRIPTS_DIR)
+    with tempfile.TemporaryDirectory() as cwd:
+        result = subprocess.run([sys.executable, '-X', 'importtime'] + args, cwd=cwd, env=env,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    # Lines look like "import time:   self |   cumulative |     botocore"
+    return any(line.split('|')[-1].strip() == 'botocore' for line in result.stderr.splitlines())
+
+
+def benchmark(name, args, expect_botocore, repeat):
+    # One untimed run so every sample sees warm bytecode caches
+    run_once(args)
+    samples = [run_once(args) for _ in range(repeat)]
+    walls = [wall for wall, _ in samples]
+    botocore = imports_botocore(args)
+    return {
+        'name': name,
+        'median_seconds': statistics.median(walls),
+        'min_seconds': min(walls),
+        'peak_rss_mb': max(rss for _, rss in samples),
+        'imports_botocore': botocore,
+        'ok': botocore == expect_botocore
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Measure drtest cold-start time and memory')
+    parser.add_argument('--repeat', type=int, default=10, help='Timed runs per invocation')
+    parser.add_argument('--output', help='Output file for the JSON report')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    results = []
+    for name, (invocation, expect_botocore) in INVOCATIONS.items():
+        print(f"Running {name}...")
+        results.append(benchmark(name, invocation, expect_botocore, args.repeat))
+
+    print("\nCold Start Summary:")
+    print(f"{'Invocation':<32} {'Median (ms)':>12} {'Min (ms)':>10} {'Peak RSS (MB)':>14}  botocore")
+    for result in results:
+        flag = 'yes' if result['imports_botocore'] else 'no'
+        if not result['ok']:
+            flag += ' (unexpected)'
+        print(f"{result['name']:<32} {result['median_seconds'] * 1000:>12.1f} "
+              f"{result['min_seconds'] * 1000:>10.1f} {result['peak_rss_mb']:>14.1f}  {flag}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'timestamp': datetime.now().isoformat(),
+                'python': sys.version.split()[0],
+                'repeat': args.repeat,
+                'results': results
+            }, f, indent=2)
+        print(f"\nDetailed report saved to: {args.output}")
+
+    return 0 if all(result['ok'] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Offline Benchmark Suite
+
+This script benchmarks the DR test script entry points against the local
+AWS stand-ins in fake_aws.py, so no AWS account or network access is needed:
+1. compare_objects() and test_restore() from drtest.s3_backup
+2. test_service_logs() from drtest.log_aggregation
+3. create_dashboard() resource discovery from drtest.dashboard
+
+Each benchmark runs in a fresh subprocess and reports wall time, API call
+counts and peak RSS. Results can be compared against a saved baseline to
+fail CI on regressions.
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(BENCHMARK_DIR, '..', 'scripts')
+sys.path[:0] = [BENCHMARK_DIR, SCRIPTS_DIR]
+
+BENCHMARKS = ('s3-compare', 's3-restore', 'logs', 'dashboard')
+REGION = 'us-east-1'
+ENV_NAME = 'dr-test'
+
+
+def load_tool(name):
+    """Import one of the drtest tool modules"""
+    return importlib.import_module(f"drtest.{name}")
+
+
+def bench_s3_compare(args, fake_aws, stats):
+    module = load_tool('s3_backup')
+    s3 = fake_aws.FakeS3(
+        stats,
+        [
+            fake_aws.FakeBucket('source', args.objects),
+            fake_aws.FakeBucket('destination', args.objects, missing_every=1000, mismatch_every=1000)
+        ],
+        latency=args.latency_ms / 1000,
+        max_rps=args.max_rps
+    )
+    results = module.compare_objects(s3, 'source', 'destination', '', args.workers)
+    return {
+        'objects': args.objects,
+        'matching_objects': results['matching_objects'],
+        'missing_objects': results['missing_objects'],
+        'mismatched_objects': len(results['mismatched_objects'])
+    }
+
+
+def bench_s3_restore(args, fake_aws, stats):
+    module = load_tool('s3_backup')
+    s3 = fake_aws.FakeS3(
+        stats,
+        [fake_aws.FakeBucket('source', args.objects), fake_aws.FakeBucket('restore', 0)],
+        latency=args.latency_ms / 1000,
+        max_rps=args.max_rps
+    )
+    sample_keys = [fake_aws.FakeBucket.key_for(index) for index in range(min(args.samples, args.objects))]
+    results = module.test_restore(s3, 'source', 'restore', sample_keys)
+    return {
+        'samples': len(sample_keys),
+        'successful_restores': results['successful_restores'],
+        'failed_restores': results['failed_restores']
+    }
+
+
+def bench_logs(args, fake_aws, stats):
+    module = load_tool('log_aggregation')
+    logs = fake_aws.FakeLogs(stats, latency=args.latency_ms / 1000, max_rps=args.max_rps)
+    module.aws_clients = fake_aws.FakeClientFactory({'logs': logs})
+    module.time = fake_aws.VirtualTime()
+
+    services = max(1, args.streams // 50)
+    per_service = args.streams // services
+    successful = 0
+    for service_index in range(services):
+        service_name = f"service-{service_index}"
+        config = {
+            'service_name': service_name,
+            'log_group': f"/dr-test/{service_name}",
+            'log_sources': [{'id': f"instance-{index}"} for index in range(per_service)]
+        }
+        results = module.test_service_logs(config, REGION)
+        successful += sum(1 for result in results if result['status'] == 'SUCCESS')
+
+    return {
+        'log_streams': services * per_service,
+        'successful_sources': successful,
+        'simulated_sleep_seconds': module.time.simulated_seconds
+    }
+
+
+def bench_dashboard(args, fake_aws, stats):
+    module = load_tool('dashboard')
+    options = {'latency': args.latency_ms / 1000, 'max_rps': args.max_rps, 'region': REGION}
+    cloudwatch = fake_aws.FakeCloudWatch(stats, **options)
+    module.aws_clients = fake_aws.FakeClientFactory({
+        'cloudwatch': cloudwatch,
+        'ec2': fake_aws.FakeEC2(stats, args.resources, ENV_NAME, **options),
+        'rds': fake_aws.FakeRDS(stats, args.resources, ENV_NAME, **options),
+        'elbv2': fake_aws.FakeELBv2(stats, args.resources, ENV_NAME, **options)
+    })
+
+    dashboard_name, dashboard_body = module.create_dashboard(ENV_NAME, REGION, None)
+    return {
+        'resources_per_type': args.resources,
+        'widgets': len(dashboard_body['widgets']),
+        'dashboard_bytes': len(cloudwatch.dashboards[dashboard_name])
+    }
+
+
+BENCHMARK_FUNCTIONS = {
+    's3-compare': bench_s3_compare,
+    's3-restore': bench_s3_restore,
+    'logs': bench_logs,
+    'dashboard': bench_dashboard,
+}
+
+
+def run_one(name, args):
+    """Run a single benchmark in this process and return its measurements"""
+    import fake_aws
+
+    stats = fake_aws.CallStats()
+    started = time.perf_counter()
+    # The scripts print progress for every resource; keep it out of the results
+    with contextlib.redirect_stdout(io.StringIO()):
+        details = BENCHMARK_FUNCTIONS[name](args, fake_aws, stats)
+    wall_time = time.perf_counter() - started
+
+    return {
+        'benchmark': name,
+        'wall_time_seconds': round(wall_time, 4),
+        # ru_maxrss is reported in kilobytes on Linux
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'api': stats.summary(),
+        'details': details
+    }
+
+
+def run_isolated(name, args):
+    """Run a benchmark in a fresh interpreter so peak RSS is per benchmark"""
+    command = [
+        sys.executable, os.path.abspath(__file__), '--run-one', name,
+        '--objects', str(args.objects),
+        '--samples', str(args.samples),
+        '--streams', str(args.streams),
+        '--resources', str(args.resources),
+        '--workers', str(args.workers),
+        '--latency-ms', str(args.latency_ms)
+    ]
+    if args.max_rps:
+        command += ['--max-rps', str(args.max_rps)]
+
+    completed = subprocess.run(command, capture_output=True, text=True)
+    if completed.returncode != 0:
+        return {'benchmark': name, 'error': completed.stderr.strip().splitlines()[-1:]}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def find_regressions(results, baseline, max_regression):
+    """Compare results with a baseline report and list any regressions"""
+    previous = {result['benchmark']: result for result in baseline.get('results', [])}
+    regressions = []
+
+    for result in results:
+        before = previous.get(result['benchmark'])
+        if before is None or 'error' in result or 'error' in before:
+            continue
+
+        checks = (
+            ('wall_time_seconds', result['wall_time_seconds'], before['wall_time_seconds']),
+            ('peak_rss_mb', result['peak_rss_mb'], before['peak_rss_mb']),
+            ('api_calls', result['api']['total_calls'], before['api']['total_calls'])
+        )
+        for metric, current, reference in checks:
+            if reference and current > reference * (1 + max_regression):
+                regressions.append({
+                    'benchmark': result['benchmark'],
+                    'metric': metric,
+                    'baseline': reference,
+                    'current': current,
+                    'change_percent': round(((current - reference) / reference) * 100, 1)
+                })
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline benchmarks for the DR test scripts')
+    parser.add_argument('--benchmark', action='append', choices=BENCHMARKS,
+                        help='Benchmark to run (repeatable, default: all)')
+    parser.add_argument('--objects', type=int, default=10000, help='Objects in the source bucket')
+    parser.add_argument('--samples', type=int, default=100, help='Objects restored by s3-restore')
+    parser.add_argument('--streams', type=int, default=20, help='Log streams tested by logs')
+    parser.add_argument('--resources', type=int, default=20,
+                        help='EC2 instances, RDS instances and load balancers for dashboard')
+    parser.add_argument('--workers', type=int, default=16, help='Worker threads for compare_objects')
+    parser.add_argument('--latency-ms', type=float, default=1.0, help='Injected latency per API call')
+    parser.add_argument('--max-rps', type=float, default=None,
+                        help='Stand-in request quota per API; excess calls are throttled')
+    parser.add_argument('--output', default='benchmark-report.json', help='Report output file')
+    parser.add_argument('--baseline', help='Previous benchmark report to compare against')
+    parser.add_argument('--max-regression', type=float, default=0.25,
+                        help='Allowed fractional increase over the baseline before failing')
+    parser.add_argument('--run-one', choices=BENCHMARKS, help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.run_one:
+        print(json.dumps(run_one(args.run_one, args)))
+        return
+
+    start_time = datetime.utcnow()
+    results = []
+    for name in args.benchmark or BENCHMARKS:
+        print(f"Running {name}...")
+        results.append(run_isolated(name, args))
+
+    report = {
+        'test_name': 'Offline Benchmark Suite',
+        'start_time': start_time.isoformat(),
+        'parameters': {
+            'objects': args.objects,
+            'samples': args.samples,
+            'streams': args.streams,
+            'resources': args.resources,
+            'workers': args.workers,
+            'latency_ms': args.latency_ms,
+            'max_rps': args.max_rps
+        },
+        'results': results
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            regressions = find_regressions(results, json.load(f), args.max_regression)
+        report['regressions'] = regressions
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print("\nBenchmark Summary:")
+    print(f"{'Benchmark':<12} {'Wall (s)':>10} {'API calls':>10} {'Throttles':>10} {'Peak RSS (MB)':>14}")
+    for result in results:
+        if 'error' in result:
+            print(f"{result['benchmark']:<12} ERROR: {' '.join(result['error'])}")
+            continue
+        print(f"{result['benchmark']:<12} {result['wall_time_seconds']:>10.3f} "
+              f"{result['api']['total_calls']:>10} {result['api']['total_throttles']:>10} "
+              f"{result['peak_rss_mb']:>14.1f}")
+
+    for regression in regressions:
+        print(f"REGRESSION: {regression['benchmark']} {regression['metric']} "
+              f"{regression['baseline']} -> {regression['current']} (+{regression['change_percent']}%)")
+
+    print(f"\nDetailed report saved to: {args.output}")
+
+    if regressions or any('error' in result for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
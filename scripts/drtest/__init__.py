@@ -0,0 +1,9 @@
+"""
+DR test tools and their shared helpers.
+
+Run the tools with `drtest <command>` (or `python -m drtest`) once the
+package is installed. The scripts under scripts/ add this directory's
+parent to sys.path so they also work from a plain checkout.
+
+Keep this module free of imports: every command loads it first.
+"""
@@ -0,0 +1,5 @@
+import sys
+
+from drtest.cli import main
+
+sys.exit(main())
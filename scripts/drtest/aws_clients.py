@@ -0,0 +1,106 @@
+"""
+Shared boto3 session and client factory.
+
+Sessions and clients are cached per profile/region so every script (and
+every thread within a script) reuses the same connection pools. Each client
+is wired to the adaptive rate limiters in drtest.ratelimit: a token is taken
+before every HTTP attempt and throttling responses reduce the shared rate
+for that API. Attempts and payload sizes are also reported to drtest.tracing.
+
+boto3 and botocore are imported on first use so tools that exit early
+(--help, bad arguments, sample configuration) never pay for them.
+"""
+
+import threading
+
+from drtest import ratelimit, tracing
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_ATTEMPTS = 8
+
+_sessions = {}
+_clients = {}
+_lock = threading.RLock()
+
+
+def get_session(profile=None, region=None):
+    """Return a cached boto3 session for a profile/region"""
+    key = (profile, region)
+    with _lock:
+        session = _sessions.get(key)
+        if session is None:
+            import boto3
+            session = boto3.Session(profile_name=profile, region_name=region)
+            _sessions[key] = session
+        return session
+
+
+def _content_length(headers):
+    try:
+        return int(headers.get('Content-Length') or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def instrument_events(events, region, service):
+    """
+    Register the rate limiting and tracing handlers on a botocore event
+    emitter for one service's before-send and needs-retry events.
+
+    Clients from get_client() are wired up this way; the offline benchmark
+    stand-ins emit the same events through their own emitter.
+    """
+
+    def before_send(event_name, request=None, **kwargs):
+        operation = event_name.rsplit('.', 1)[-1]
+        ratelimit.get_limiter(region, service, operation).acquire()
+        tracing.record_request(service, operation, _content_length(request.headers) if request else 0)
+
+    def needs_retry(event_name, response=None, **kwargs):
+        if response is None:
+            return
+        operation = event_name.rsplit('.', 1)[-1]
+        limiter = ratelimit.get_limiter(region, service, operation)
+        throttled = ratelimit.is_throttle_response(*response)
+        if throttled:
+            limiter.on_throttle()
+        else:
+            limiter.on_success()
+        # HEAD responses report the object's size but carry no body
+        received = 0 if operation.startswith('Head') else _content_length(response[0].headers)
+        tracing.record_response(received, throttled)
+        # Returning None leaves the retry decision to botocore
+
+    events.register(f"before-send.{service}", before_send)
+    events.register(f"needs-retry.{service}", needs_retry)
+
+
+def _instrument_client(client):
+    instrument_events(client.meta.events, client.meta.region_name,
+                      client.meta.service_model.service_id.hyphenize())
+
+
+def get_client(service, profile=None, region=None, max_workers=DEFAULT_POOL_SIZE):
+    """
+    Return a cached, rate-limited client.
+
+    max_workers is the number of threads that will share the client; the
+    connection pool is sized so none of them wait for a free connection.
+    Clients are cached per pool size, so callers asking for a larger pool
+    get a client sized for it.
+    """
+    pool_size = max(DEFAULT_POOL_SIZE, max_workers)
+    key = (service, profile, region, pool_size)
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            from botocore.config import Config
+            config = Config(
+                max_pool_connections=pool_size,
+                retries={'mode': 'standard', 'max_attempts': DEFAULT_MAX_ATTEMPTS}
+            )
+            client = get_session(profile, region).client(service, config=config)
+            _instrument_client(client)
+            _clients[key] = client
+        return client
@@ -0,0 +1,52 @@
+"""
+Single entry point for the DR test tools.
+
+    drtest <command> [options]
+    python -m drtest <command> [options]
+
+Only the module for the chosen command is imported, and the tools import
+boto3 and create clients when they first call AWS, so `--help`, argument
+errors and other no-op invocations start without loading botocore.
+"""
+
+import importlib
+import sys
+
+# command: (module, summary)
+COMMANDS = {
+    's3-backup': ('drtest.s3_backup', 'Validate S3 bucket replication and test restores'),
+    'log-aggregation': ('drtest.log_aggregation', 'Check that test log events are aggregated'),
+    'dashboard': ('drtest.dashboard', 'Create the CloudWatch dashboard for DR testing'),
+    'fis-steady-state': ('drtest.steady_state', 'Run an FIS experiment with steady-state sampling'),
+    'validate': ('drtest.validation_suite', 'Run the DR validation suite from an execution plan'),
+    'report-store': ('drtest.report_cli', 'Ingest and query historical test reports'),
+}
+
+
+def usage():
+    lines = ['usage: drtest <command> [options]', '', 'commands:']
+    lines += [f"  {name:<18} {summary}" for name, (_, summary) in COMMANDS.items()]
+    lines += ['', "Run 'drtest <command> --help' for a command's options."]
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+
+    if not argv or argv[0] in ('-h', '--help'):
+        print(usage())
+        return 0 if argv else 2
+
+    command = argv[0]
+    if command not in COMMANDS:
+        print(f"drtest: unknown command '{command}'\n\n{usage()}", file=sys.stderr)
+        return 2
+
+    module = importlib.import_module(COMMANDS[command][0])
+    # argparse takes the program name shown in usage messages from argv[0]
+    sys.argv[0] = f"drtest {command}"
+    return module.main(argv[1:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""
+Buffered publisher for the custom DRTest CloudWatch metrics.
+
+Recording a metric only updates an in-memory aggregate under a lock, so it
+is cheap enough for hot loops and never does network I/O on the caller's
+thread. A background thread flushes the buffer on a timer (or early once
+a full batch is waiting):
+- cloudwatch mode sends one statistic set (SampleCount/Sum/Min/Max) per
+  metric and dimension set, in PutMetricData batches of up to 1000 datums
+- emf mode writes Embedded Metric Format JSON lines, for the CloudWatch
+  agent or a log subscription to turn into metrics, to stderr or appended
+  to a file so they stay out of the scripts' stdout summaries
+
+Scripts call configure() once (usually behind a --publish-metrics flag) and
+then record(); until configure() is called record() does nothing.
+"""
+
+import atexit
+import json
+import sys
+import threading
+import time
+
+DEFAULT_NAMESPACE = 'DRTest'
+MAX_BATCH_SIZE = 1000
+# EMF allows at most 100 values per metric in one log line
+MAX_EMF_VALUES = 100
+
+
+class CloudWatchSink:
+    """Publishes aggregated entries as PutMetricData statistic sets"""
+
+    def __init__(self, namespace, profile=None, region=None):
+        self.namespace = namespace
+        self.profile = profile
+        self.region = region
+        self._client = None
+
+    def _get_client(self):
+        # Created on the flusher thread so configure() stays cheap
+        if self._client is None:
+            from drtest import aws_clients
+            self._client = aws_clients.get_client('cloudwatch', profile=self.profile, region=self.region)
+        return self._client
+
+    def publish(self, entries, timestamp):
+        data = [
+            {
+                'MetricName': name,
+                'Dimensions': [{'Name': key, 'Value': value} for key, value in dimensions],
+                'Timestamp': timestamp,
+                'Unit': unit,
+                'StatisticValues': {
+                    'SampleCount': stats[0],
+                    'Sum': stats[1],
+                    'Minimum': stats[2],
+                    'Maximum': stats[3]
+                }
+            }
+            for (name, dimensions, unit), (stats, _) in entries
+        ]
+        client = self._get_client()
+        for start in range(0, len(data), MAX_BATCH_SIZE):
+            client.put_metric_data(Namespace=self.namespace, MetricData=data[start:start + MAX_BATCH_SIZE])
+
+
+class EmfSink:
+    """Writes entries as Embedded Metric Format log lines"""
+
+    def __init__(self, namespace, stream=None, path=None):
+        self.namespace = namespace
+        self.stream = stream or sys.stderr
+        self.path = path
+
+    def publish(self, entries, timestamp):
+        lines = []
+        for (name, dimensions, unit), (_, values) in entries:
+            for start in range(0, len(values), MAX_EMF_VALUES):
+                line = {
+                    '_aws': {
+                        'Timestamp': int(timestamp * 1000),
+                        'CloudWatchMetrics': [{
+                            'Namespace': self.namespace,
+                            'Dimensions': [[key for key, _ in dimensions]],
+                            'Metrics': [{'Name': name, 'Unit': unit}]
+                        }]
+                    },
+                    name: values[start:start + MAX_EMF_VALUES]
+                }
+                line.update(dict(dimensions))
+                lines.append(json.dumps(line))
+        text = '\n'.join(lines) + '\n'
+        if self.path:
+            # Reopened on every flush so the agent's log rotation is honoured
+            with open(self.path, 'a') as f:
+                f.write(text)
+        else:
+            self.stream.write(text)
+            self.stream.flush()
+
+
+class MetricsEmitter:
+    """Aggregates data points in memory and flushes them from a background thread"""
+
+    def __init__(self, sink, flush_interval=10.0, keep_values=False):
+        self.sink = sink
+        self.flush_interval = flush_interval
+        self.keep_values = keep_values
+        self.flush_count = 0
+        self.error_count = 0
+        self._buffer = {}
+        self._window_start = time.time()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='drtest-metrics', daemon=True)
+        self._thread.start()
+
+    def record(self, name, value, unit='None', dimensions=None):
+        """Add a data point; dimensions is a dict of name to value"""
+        key = (name, tuple(sorted(dimensions.items())) if dimensions else (), unit)
+        with self._lock:
+            entry = self._buffer.get(key)
+            if entry is None:
+                entry = self._buffer[key] = ([0, 0.0, value, value], [] if self.keep_values else None)
+                if len(self._buffer) >= MAX_BATCH_SIZE:
+                    self._wake.set()
+            stats = entry[0]
+            stats[0] += 1
+            stats[1] += value
+            if value < stats[2]:
+                stats[2] = value
+            if value > stats[3]:
+                stats[3] = value
+            if self.keep_values:
+                entry[1].append(value)
+
+    def flush(self):
+        """Publish everything buffered so far; called from the flusher thread"""
+        with self._lock:
+            entries, self._buffer = self._buffer, {}
+            timestamp, self._window_start = self._window_start, time.time()
+        if not entries:
+            return
+        try:
+            self.sink.publish(list(entries.items()), timestamp)
+            self.flush_count += 1
+        except Exception as e:
+            self.error_count += 1
+            print(f"Error publishing {len(entries)} DRTest metrics: {str(e)}", file=sys.stderr)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def close(self):
+        """Stop the flusher thread after a final flush"""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        self._wake.set()
+        self._thread.join()
+        self.flush()
+
+
+_emitter = None
+
+
+def configure(mode='cloudwatch', namespace=DEFAULT_NAMESPACE, profile=None, region=None,
+              flush_interval=10.0, stream=None, emf_file=None):
+    """Start the process-wide emitter used by record()"""
+    global _emitter
+    if _emitter is not None:
+        _emitter.close()
+    if mode == 'emf':
+        _emitter = MetricsEmitter(EmfSink(namespace, stream, emf_file), flush_interval, keep_values=True)
+    else:
+        _emitter = MetricsEmitter(CloudWatchSink(namespace, profile, region), flush_interval)
+    return _emitter
+
+
+def record(name, value, unit='None', dimensions=None):
+    """Record a data point if an emitter is configured"""
+    if _emitter is not None:
+        _emitter.record(name, value, unit, dimensions)
+
+
+def close():
+    """Flush and stop the process-wide emitter"""
+    global _emitter
+    if _emitter is not None:
+        _emitter.close()
+        _emitter = None
+
+
+atexit.register(close)
@@ -0,0 +1,146 @@
+"""
+Adaptive rate limiting for AWS API calls.
+
+Each limiter is a token bucket whose refill rate follows AIMD (additive
+increase, multiplicative decrease): every throttled response halves the
+rate and every successful call nudges it back up towards the ceiling.
+Limiters are shared per region/service/API so that concurrent callers in
+the same process back off together instead of starving each other.
+"""
+
+import threading
+import time
+
+THROTTLE_ERROR_CODES = {
+    'Throttling',
+    'ThrottlingException',
+    'ThrottledException',
+    'RequestThrottled',
+    'RequestThrottledException',
+    'TooManyRequestsException',
+    'ProvisionedThroughputExceededException',
+    'RequestLimitExceeded',
+    'BandwidthLimitExceeded',
+    'LimitExceededException',
+    'EC2ThrottledException',
+    'PriorRequestNotComplete',
+    'SlowDown',
+}
+
+# HEAD requests carry no error body, so S3 SlowDown only shows up as a 503
+THROTTLE_STATUS_CODES = {429, 503}
+
+# Starting (and maximum) requests per second for APIs with low documented
+# quotas. Anything not listed here uses DEFAULT_RATE.
+DEFAULT_RATE = 50.0
+API_RATES = {
+    ('s3', 'HeadObject'): 5500.0,
+    ('s3', 'GetObject'): 5500.0,
+    ('s3', 'CopyObject'): 3500.0,
+    ('s3', 'PutObject'): 3500.0,
+    ('s3', 'ListObjectsV2'): 100.0,
+    ('cloudwatch-logs', 'DescribeLogStreams'): 25.0,
+    ('cloudwatch-logs', 'FilterLogEvents'): 5.0,
+    ('cloudwatch-logs', 'PutLogEvents'): 800.0,
+    ('cloudwatch-logs', 'CreateLogStream'): 50.0,
+    ('cloudwatch-logs', 'CreateLogGroup'): 5.0,
+    ('cloudwatch', 'GetMetricData'): 50.0,
+    ('cloudwatch', 'PutMetricData'): 150.0,
+    ('cloudwatch', 'PutDashboard'): 10.0,
+    ('elastic-load-balancing-v2', 'DescribeTags'): 10.0,
+    ('elastic-load-balancing-v2', 'DescribeLoadBalancers'): 10.0,
+}
+
+
+class AdaptiveRateLimiter:
+    """Token bucket with an AIMD-controlled refill rate"""
+
+    def __init__(self, max_rate, min_rate=0.5, increase=None, decrease=0.5, burst=None, cooldown=0.5):
+        self.max_rate = float(max_rate)
+        self.min_rate = min(float(min_rate), self.max_rate)
+        # By default recover from the minimum to the ceiling in ~20 seconds
+        self.increase = increase if increase is not None else max(1.0, self.max_rate / 20)
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self._last_decrease = None
+        self.rate = self.max_rate
+        self.capacity = burst if burst is not None else max(1.0, self.max_rate)
+        self.tokens = self.capacity
+        self.throttle_count = 0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Block until a token is available; returns the time spent waiting"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def on_throttle(self):
+        """Multiplicative decrease after a throttled response"""
+        with self._lock:
+            self.throttle_count += 1
+            # Requests already in flight get throttled together; treat them
+            # as one congestion signal rather than halving once per response
+            now = time.monotonic()
+            if self._last_decrease is not None and now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            # Drop any accumulated burst so the lower rate takes effect now
+            self.tokens = min(self.tokens, 1.0)
+
+    def on_success(self):
+        """Additive increase, scaled so the rate grows by ~`increase` per second"""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(region, service, operation):
+    """Return the process-wide limiter for a region/service/API"""
+    key = (region, service, operation)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(API_RATES.get((service, operation), DEFAULT_RATE))
+            _limiters[key] = limiter
+        return limiter
+
+
+def limiter_stats():
+    """Current rate and throttle counts for every limiter in use"""
+    with _limiters_lock:
+        return {
+            '/'.join(str(part) for part in key): {
+                'rate': round(limiter.rate, 2),
+                'max_rate': limiter.max_rate,
+                'throttle_count': limiter.throttle_count
+            }
+            for key, limiter in _limiters.items()
+        }
+
+
+def is_throttle_response(http_response, parsed):
+    """Check whether a botocore response is a throttling error"""
+    if http_response is not None and http_response.status_code in THROTTLE_STATUS_CODES:
+        return True
+    if not parsed:
+        return False
+    return parsed.get('Error', {}).get('Code') in THROTTLE_ERROR_CODES
@@ -0,0 +1,39 @@
+"""
+Locate the DR-Test-Environment checkout that config/ and test-reports/
+defaults are resolved against.
+
+The package can be installed away from the repository, so the location of
+this file is only used when it still sits inside a checkout. In order:
+1. the DRTEST_REPO environment variable
+2. the current directory or one of its parents
+3. the checkout this package was loaded from
+"""
+
+import os
+
+REPO_ENV = 'DRTEST_REPO'
+# A file every checkout has and an installed package never sits next to
+MARKER = os.path.join('config', 'dr-validation-plan.json')
+
+
+def is_repo(path):
+    return os.path.isfile(os.path.join(path, MARKER))
+
+
+def find_repo_root():
+    """Return the repository root, or None when it cannot be found"""
+    configured = os.environ.get(REPO_ENV)
+    if configured:
+        return os.path.abspath(configured)
+
+    path = os.getcwd()
+    while True:
+        if is_repo(path):
+            return path
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+
+    source = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+    return source if is_repo(source) else None
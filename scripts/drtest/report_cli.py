@@ -0,0 +1,253 @@
+"""
+Historical Report Store
+
+This script keeps an indexed history of the JSON reports written by the DR
+test scripts so trends can be queried across runs:
+1. ingest  - load report files or directories into the SQLite store
+2. runs    - list stored runs
+3. metrics - list the metrics stored for a test type
+4. percentile / trend - percentile and per-period trend queries for a metric
+5. fill    - fill a test-reports/templates/ report from a stored run
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+from drtest.repo import REPO_ENV, find_repo_root
+
+DB_ENV = 'DRTEST_REPORT_DB'
+ENVIRONMENT_NAMES = {'dev': 'Development', 'prod': 'Production', 'dr': 'DR'}
+
+
+def find_report_files(paths):
+    """Expand files, directories and glob patterns into JSON report paths"""
+    for path in paths:
+        if os.path.isdir(path):
+            yield from sorted(glob.glob(os.path.join(path, '**', '*.json'), recursive=True))
+        else:
+            yield from sorted(glob.glob(path)) or [path]
+
+
+def cmd_ingest(store, args):
+    from drtest.report_store import NotAReportError
+
+    ingested = skipped = ignored = failed = 0
+    for path in find_report_files(args.paths):
+        # Every report is committed on its own, so one bad file only costs itself
+        try:
+            run_id = store.ingest_file(path, args.environment)
+        except NotAReportError as e:
+            if args.verbose:
+                print(f"Ignoring {path}: {e}")
+            ignored += 1
+            continue
+        except Exception as e:
+            print(f"Error ingesting {path}: {e}")
+            failed += 1
+            continue
+        if run_id is None:
+            skipped += 1
+        else:
+            ingested += 1
+            if args.verbose:
+                print(f"Ingested {path} as run {run_id}")
+
+    print(f"Ingested {ingested} reports ({skipped} already stored, {ignored} not reports, {failed} failed)")
+    return 1 if failed else 0
+
+
+def cmd_runs(store, args):
+    rows = store.runs(args.test_type, args.environment, args.limit)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+    print(f"{'ID':>6}  {'Date':<10}  {'Type':<18} {'Environment':<12} {'Duration (s)':>12}  Status")
+    for row in rows:
+        duration = f"{row['duration_seconds']:.1f}" if row['duration_seconds'] is not None else '-'
+        print(f"{row['id']:>6}  {row['run_date']:<10}  {row['test_type']:<18} {row['environment']:<12} "
+              f"{duration:>12}  {row['status'] or '-'}")
+    return 0
+
+
+def cmd_metrics(store, args):
+    for name in store.metric_names(args.test_type):
+        print(name)
+    return 0
+
+
+def cmd_percentile(store, args):
+    result = store.percentiles(
+        args.test_type, args.metric, args.percentiles, args.environment, args.since, args.until
+    )
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+    print(f"{args.test_type} {args.metric} over {result['run_count']} runs:")
+    for key, value in result.items():
+        if key not in ('metric', 'test_type', 'run_count'):
+            print(f"  {key:<6} {value:.3f}" if value is not None else f"  {key:<6} -")
+    return 0
+
+
+def cmd_trend(store, args):
+    result = store.trend(args.test_type, args.metric, args.period, args.environment, args.since, args.until)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+    print(f"{args.test_type} {args.metric} by {args.period}:")
+    print(f"{'Period':<12} {'Runs':>6} {'Mean':>12} {'Min':>12} {'Max':>12}")
+    for row in result['periods']:
+        print(f"{row['period']:<12} {row['run_count']:>6} {row['mean']:>12.3f} {row['min']:>12.3f} {row['max']:>12.3f}")
+    if result['slope_per_period'] is not None:
+        print(f"Trend: {result['slope_per_period']:+.3f} per {args.period}")
+    return 0
+
+
+def fill_template(template, run, metrics, history):
+    """Replace the header placeholders and add the stored metrics to a template"""
+    environment = run['environment']
+    replacements = {
+        '[Unique Test ID]': f"{run['test_type']}-{run['id']}",
+        '[Test Date]': run['run_date'],
+        '[Start Time]': run['start_time'] or '-',
+        '[End Time]': run['end_time'] or '-',
+        '[Development/Production/DR]': ENVIRONMENT_NAMES.get(environment, environment),
+        '[Test Scenario Name]': run['test_name'],
+    }
+    for placeholder, value in replacements.items():
+        template = template.replace(placeholder, value, 1)
+
+    lines = [
+        f"Metrics from `{os.path.basename(run['source_path'])}` compared with the "
+        f"{history['run_count']} {run['test_type']} runs in {environment} up to {run['run_date']}:",
+        '',
+        '| Metric | This Run | Historical p50 | Historical p95 |',
+        '|--------|----------|----------------|----------------|',
+    ]
+    for name, value in metrics.items():
+        stats = history['metrics'].get(name, {})
+        p50 = f"{stats['p50']:.3f}" if stats.get('p50') is not None else '-'
+        p95 = f"{stats['p95']:.3f}" if stats.get('p95') is not None else '-'
+        lines.append(f"| {name} | {value:.3f} | {p50} | {p95} |")
+    table = '\n'.join(lines)
+
+    placeholder = '[Include links or screenshots of relevant CloudWatch metrics]'
+    if placeholder in template:
+        return template.replace(placeholder, f"{table}\n\n{placeholder}", 1)
+    return f"{template.rstrip()}\n\n## Stored Metrics\n\n{table}\n"
+
+
+def cmd_fill(store, args):
+    if args.run_id:
+        rows = [dict(row) for row in store.conn.execute('SELECT * FROM runs WHERE id = ?', (args.run_id,))]
+    else:
+        rows = store.runs(args.test_type, args.environment, limit=1)
+    if not rows:
+        print("No matching run found in the report store")
+        return 1
+    run = rows[0]
+
+    metrics = store.metrics_for_run(run['id'])
+    history = {'run_count': 0, 'metrics': {}}
+    for name in metrics:
+        result = store.percentiles(
+            run['test_type'], name, (50, 95), run['environment'], until=run['run_date']
+        )
+        history['metrics'][name] = result
+        history['run_count'] = max(history['run_count'], result['run_count'])
+
+    with open(args.template, 'r') as f:
+        template = f.read()
+    filled = fill_template(template, run, metrics, history)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(filled)
+        print(f"Report saved to: {args.output}")
+    else:
+        print(filled)
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Historical report store for DR test results')
+    parser.add_argument('--db', default=os.environ.get(DB_ENV),
+                        help=f"SQLite database file (default: ${DB_ENV}, or test-reports/history.db in the repository)")
+    parser.add_argument('--timing', action='store_true', help='Print the query time')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    ingest = subparsers.add_parser('ingest', help='Load JSON reports into the store')
+    ingest.add_argument('paths', nargs='+', help='Report files, directories or glob patterns')
+    ingest.add_argument('--environment', help='Environment to record when the report has none')
+    ingest.add_argument('--verbose', action='store_true', help='List every ingested or ignored file')
+
+    runs = subparsers.add_parser('runs', help='List stored runs, newest first')
+    runs.add_argument('--test-type', help='Filter by test type, e.g. s3-backup')
+    runs.add_argument('--environment', help='Filter by environment')
+    runs.add_argument('--limit', type=int, default=20, help='Number of runs to show')
+    runs.add_argument('--json', action='store_true', help='Print JSON')
+
+    metrics = subparsers.add_parser('metrics', help='List stored metric names for a test type')
+    metrics.add_argument('--test-type', required=True, help='Test type, e.g. s3-backup')
+
+    for name, help_text in (('percentile', 'Percentiles of a metric across runs'),
+                            ('trend', 'Per-period trend of a metric')):
+        query = subparsers.add_parser(name, help=help_text)
+        query.add_argument('--test-type', required=True, help='Test type, e.g. s3-backup')
+        query.add_argument('--metric', required=True, help='Metric name, e.g. duration_seconds')
+        query.add_argument('--environment', help='Filter by environment')
+        query.add_argument('--since', help='First run date (YYYY-MM-DD)')
+        query.add_argument('--until', help='Last run date (YYYY-MM-DD)')
+        query.add_argument('--json', action='store_true', help='Print JSON')
+        if name == 'percentile':
+            query.add_argument('--percentiles', type=float, nargs='+', default=[50, 90, 95, 99],
+                               help='Percentiles to compute')
+        else:
+            query.add_argument('--period', choices=('day', 'week', 'month'), default='day',
+                               help='Aggregation period')
+
+    fill = subparsers.add_parser('fill', help='Fill a report template from a stored run')
+    fill.add_argument('--template', required=True, help='Template from test-reports/templates/')
+    fill.add_argument('--run-id', type=int, help='Stored run ID (default: latest matching run)')
+    fill.add_argument('--test-type', help='Test type of the latest run to use')
+    fill.add_argument('--environment', help='Environment of the latest run to use')
+    fill.add_argument('--output', help='Output file (default: stdout)')
+
+    args = parser.parse_args(argv)
+
+    if args.db is None:
+        repo = find_repo_root()
+        if repo is None:
+            parser.error(f"--db is required outside a DR-Test-Environment checkout (or set ${DB_ENV} or ${REPO_ENV})")
+        args.db = os.path.join(repo, 'test-reports', 'history.db')
+
+    commands = {
+        'ingest': cmd_ingest,
+        'runs': cmd_runs,
+        'metrics': cmd_metrics,
+        'percentile': cmd_percentile,
+        'trend': cmd_trend,
+        'fill': cmd_fill,
+    }
+
+    # sqlite3 is only needed once a command actually runs
+    from drtest.report_store import ReportStore
+
+    store = ReportStore(args.db)
+    started = time.perf_counter()
+    try:
+        exit_code = commands[args.command](store, args)
+    finally:
+        store.close()
+
+    if args.timing:
+        print(f"Completed in {(time.perf_counter() - started) * 1000:.1f} ms", file=sys.stderr)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,336 @@
+"""
+Indexed SQLite store for historical test reports.
+
+Each JSON report written by the DR test scripts is ingested once into:
+- runs: one row per report (test type, environment, times, status)
+- metrics: the report's numeric results, one row per metric, with the run's
+  test type, environment and date copied in so trend and percentile queries
+  are served from a single covering index
+- daily_summary: per test type/environment/date/metric aggregates kept up
+  to date on ingest, for trend queries that never touch individual runs
+
+Files are skipped on re-ingest when their path, size and mtime match, and
+deduplicated by content hash otherwise. JSON files without a test name
+(suite trace files, sample configs) are rejected with NotAReportError.
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import sqlite3
+from datetime import datetime
+
+from drtest.stats import percentile
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    test_type TEXT NOT NULL,
+    test_name TEXT NOT NULL,
+    environment TEXT NOT NULL,
+    start_time TEXT,
+    end_time TEXT,
+    run_date TEXT NOT NULL,
+    duration_seconds REAL,
+    status TEXT,
+    source_path TEXT NOT NULL,
+    source_size INTEGER NOT NULL,
+    source_mtime REAL NOT NULL,
+    content_sha256 TEXT NOT NULL UNIQUE,
+    ingested_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_type ON runs (test_type, environment, run_date);
+CREATE INDEX IF NOT EXISTS runs_by_source ON runs (source_path, source_size, source_mtime);
+
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    test_type TEXT NOT NULL,
+    environment TEXT NOT NULL,
+    run_date TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (run_id, name)
+);
+CREATE INDEX IF NOT EXISTS metrics_by_name ON metrics (test_type, name, environment, run_date, value);
+
+CREATE TABLE IF NOT EXISTS daily_summary (
+    test_type TEXT NOT NULL,
+    environment TEXT NOT NULL,
+    run_date TEXT NOT NULL,
+    name TEXT NOT NULL,
+    run_count INTEGER NOT NULL,
+    total REAL NOT NULL,
+    minimum REAL NOT NULL,
+    maximum REAL NOT NULL,
+    PRIMARY KEY (test_type, name, environment, run_date)
+) WITHOUT ROWID;
+"""
+
+TEST_TYPES = {
+    'S3 Backup Validation': 's3-backup',
+    'Log Aggregation Validation': 'log-aggregation',
+    'FIS Steady-State Experiment': 'fis-steady-state',
+    'DR Validation Suite': 'dr-validation',
+    'Offline Benchmark Suite': 'benchmark',
+    'CloudWatch Metric Validation': 'metric-validation',
+    'Alert Response Test': 'alert-response',
+    'File Recovery Test': 'file-recovery',
+}
+
+
+class NotAReportError(ValueError):
+    """Raised for JSON files that are not DR test reports (traces, configs)"""
+
+
+# Lists and nested sections that only hold per-item detail
+SKIPPED_KEYS = {'details', 'results', 'testResults', 'test_results', 'service_results', 'probes', 'children'}
+
+
+def _slug(text):
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-') or 'unknown'
+
+
+def _first(report, *keys):
+    # The Python scripts write snake_case keys and the shell scripts camelCase
+    for key in keys:
+        if report.get(key) not in (None, ''):
+            return report[key]
+    return None
+
+
+def _flatten(value, prefix, metrics):
+    """Collect numeric leaves of a report section as dotted metric names"""
+    if isinstance(value, bool):
+        metrics[prefix] = float(value)
+    elif isinstance(value, (int, float)):
+        if math.isfinite(value):
+            metrics[prefix] = float(value)
+    elif isinstance(value, dict):
+        for key, child in value.items():
+            if key not in SKIPPED_KEYS:
+                _flatten(child, f"{prefix}.{key}" if prefix else key, metrics)
+
+
+def extract_metrics(report):
+    """Return the numeric metrics worth keeping from a report"""
+    metrics = {}
+    _flatten({key: value for key, value in report.items() if key not in SKIPPED_KEYS}, '', metrics)
+
+    comparison = report.get('comparison_results')
+    if comparison:
+        mismatched = len(comparison.get('mismatched_objects', []))
+        metrics['comparison_results.mismatched_objects'] = float(mismatched)
+        metrics['comparison_results.objects_compared'] = float(
+            comparison.get('matching_objects', 0) + comparison.get('missing_objects', 0) + mismatched
+        )
+
+    # Suite and benchmark reports keep their per-item results in lists
+    for span in report.get('spans', []):
+        for field in ('duration_seconds', 'api_call_count', 'bytes_received'):
+            if isinstance(span.get(field), (int, float)):
+                metrics[f"check.{span['name']}.{field}"] = float(span[field])
+    for result in report.get('results', []) if report.get('test_name') == 'Offline Benchmark Suite' else []:
+        for field in ('wall_time_seconds', 'peak_rss_mb'):
+            if isinstance(result.get(field), (int, float)):
+                metrics[f"benchmark.{result['benchmark']}.{field}"] = float(result[field])
+        if 'api' in result:
+            metrics[f"benchmark.{result['benchmark']}.api_calls"] = float(result['api']['total_calls'])
+
+    # The FIS report nests everything per probe; keep the headline figures
+    for probe, result in report.get('probes', {}).items():
+        if result.get('recovery_time_seconds') is not None:
+            metrics[f"probe.{probe}.recovery_time_seconds"] = float(result['recovery_time_seconds'])
+        for phase, stats in result.get('phases', {}).items():
+            for pct in ('p50', 'p95', 'p99'):
+                if stats['latency_ms'].get(pct) is not None:
+                    metrics[f"probe.{probe}.{phase}.latency_{pct}_ms"] = float(stats['latency_ms'][pct])
+            metrics[f"probe.{probe}.{phase}.error_rate_percent"] = float(stats['error_rate_percent'])
+
+    return {name: value for name, value in metrics.items() if name}
+
+
+def is_report(report):
+    """Whether parsed JSON looks like a report written by the DR test scripts"""
+    return isinstance(report, dict) and _first(report, 'test_name', 'testName') is not None
+
+
+def _parse_time(value):
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def describe_report(report, environment=None):
+    """Work out the run attributes stored alongside a report's metrics"""
+    test_name = _first(report, 'test_name', 'testName') or 'Unknown'
+    start = _parse_time(_first(report, 'start_time', 'startTime', 'timestamp'))
+    end = _parse_time(_first(report, 'end_time', 'endTime'))
+
+    duration = _first(report, 'duration_seconds')
+    if duration is None and start and end:
+        duration = (end - start).total_seconds()
+
+    summary = report.get('summary', {})
+    status = _first(report, 'status', 'experiment_status', 'testResult')
+    if status is None and isinstance(summary, dict):
+        failures = _first(summary, 'failure_count', 'failedTests', 'failedRecoveries', 'missingMetrics')
+        if failures is not None:
+            status = 'PASSED' if failures == 0 else 'FAILED'
+
+    return {
+        'test_type': TEST_TYPES.get(test_name, _slug(test_name)),
+        'test_name': test_name,
+        'environment': _first(report, 'environment', 'env') or environment or 'unknown',
+        'start_time': start.isoformat() if start else None,
+        'end_time': end.isoformat() if end else None,
+        'run_date': (start or datetime.utcnow()).strftime('%Y-%m-%d'),
+        'duration_seconds': duration,
+        'status': status
+    }
+
+
+class ReportStore:
+    """SQLite-backed store of ingested reports"""
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA foreign_keys=ON')
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def _already_ingested(self, path, stat):
+        row = self.conn.execute(
+            'SELECT 1 FROM runs WHERE source_path = ? AND source_size = ? AND source_mtime = ?',
+            (path, stat.st_size, stat.st_mtime)
+        ).fetchone()
+        return row is not None
+
+    def ingest_file(self, path, environment=None):
+        """Ingest one report; returns the new run id, or None if already stored"""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        if self._already_ingested(path, stat):
+            return None
+
+        with open(path, 'rb') as f:
+            content = f.read()
+        digest = hashlib.sha256(content).hexdigest()
+        if self.conn.execute('SELECT 1 FROM runs WHERE content_sha256 = ?', (digest,)).fetchone():
+            return None
+
+        report = json.loads(content)
+        if not is_report(report):
+            raise NotAReportError('not a DR test report (no test_name or testName)')
+        run = describe_report(report, environment)
+        metrics = extract_metrics(report)
+        if run['duration_seconds'] is not None:
+            metrics['duration_seconds'] = float(run['duration_seconds'])
+
+        with self.conn:
+            cursor = self.conn.execute(
+                """INSERT INTO runs (test_type, test_name, environment, start_time, end_time, run_date,
+                                     duration_seconds, status, source_path, source_size, source_mtime,
+                                     content_sha256, ingested_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (run['test_type'], run['test_name'], run['environment'], run['start_time'], run['end_time'],
+                 run['run_date'], run['duration_seconds'], run['status'], path, stat.st_size,
+                 stat.st_mtime, digest, datetime.utcnow().isoformat())
+            )
+            run_id = cursor.lastrowid
+            key = (run['test_type'], run['environment'], run['run_date'])
+            self.conn.executemany(
+                'INSERT INTO metrics (run_id, test_type, environment, run_date, name, value) VALUES (?, ?, ?, ?, ?, ?)',
+                [(run_id, *key, name, value) for name, value in metrics.items()]
+            )
+            self.conn.executemany(
+                """INSERT INTO daily_summary (test_type, environment, run_date, name, run_count, total, minimum, maximum)
+                   VALUES (?, ?, ?, ?, 1, ?, ?, ?)
+                   ON CONFLICT (test_type, name, environment, run_date) DO UPDATE SET
+                       run_count = run_count + 1,
+                       total = total + excluded.total,
+                       minimum = MIN(minimum, excluded.minimum),
+                       maximum = MAX(maximum, excluded.maximum)""",
+                [(*key, name, value, value, value) for name, value in metrics.items()]
+            )
+        return run_id
+
+    def runs(self, test_type=None, environment=None, limit=20):
+        """Most recent runs, newest first"""
+        where, params = self._filters(test_type, environment)
+        return [dict(row) for row in self.conn.execute(
+            f"SELECT * FROM runs {where} ORDER BY run_date DESC, start_time DESC, id DESC LIMIT ?",
+            params + [limit]
+        )]
+
+    def metrics_for_run(self, run_id):
+        return {row['name']: row['value'] for row in self.conn.execute(
+            'SELECT name, value FROM metrics WHERE run_id = ? ORDER BY name', (run_id,)
+        )}
+
+    def metric_names(self, test_type):
+        return [row['name'] for row in self.conn.execute(
+            'SELECT DISTINCT name FROM daily_summary WHERE test_type = ? ORDER BY name', (test_type,)
+        )]
+
+    @staticmethod
+    def _filters(test_type=None, environment=None, since=None, until=None, name=None):
+        clauses, params = [], []
+        for column, value in (('test_type', test_type), ('name', name), ('environment', environment)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since:
+            clauses.append('run_date >= ?')
+            params.append(since)
+        if until:
+            clauses.append('run_date <= ?')
+            params.append(until)
+        return ('WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def percentiles(self, test_type, name, percentiles=(50, 90, 95, 99), environment=None, since=None, until=None):
+        """Percentiles of a metric across runs, computed from the covering index"""
+        where, params = self._filters(test_type, environment, since, until, name)
+        values = [row[0] for row in self.conn.execute(
+            f"SELECT value FROM metrics {where} ORDER BY value", params
+        )]
+        result = {'metric': name, 'test_type': test_type, 'run_count': len(values)}
+        if values:
+            result.update({'min': values[0], 'max': values[-1], 'mean': sum(values) / len(values)})
+        result.update({f"p{pct:g}": percentile(values, pct) for pct in percentiles})
+        return result
+
+    def trend(self, test_type, name, period='day', environment=None, since=None, until=None):
+        """Per-period aggregates of a metric from the daily summary table"""
+        bucket = {
+            'day': 'run_date',
+            'week': "strftime('%Y-W%W', run_date)",
+            'month': "substr(run_date, 1, 7)",
+        }[period]
+        where, params = self._filters(test_type, environment, since, until, name)
+        rows = [dict(row) for row in self.conn.execute(
+            f"""SELECT {bucket} AS period, SUM(run_count) AS run_count, SUM(total) / SUM(run_count) AS mean,
+                       MIN(minimum) AS min, MAX(maximum) AS max
+                FROM daily_summary {where} GROUP BY period ORDER BY period""",
+            params
+        )]
+
+        # Least-squares slope of the period means, in metric units per period
+        slope = None
+        if len(rows) > 1:
+            xs = range(len(rows))
+            x_mean = (len(rows) - 1) / 2
+            y_mean = sum(row['mean'] for row in rows) / len(rows)
+            denominator = sum((x - x_mean) ** 2 for x in xs)
+            slope = sum((x - x_mean) * (row['mean'] - y_mean) for x, row in zip(xs, rows)) / denominator
+
+        return {'metric': name, 'test_type': test_type, 'period': period, 'slope_per_period': slope, 'periods': rows}
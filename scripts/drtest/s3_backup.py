@@ -0,0 +1,224 @@
+"""
+S3 Backup Validation Script
+
+This script validates S3 bucket replications and backup strategies by:
+1. Comparing source and destination buckets
+2. Validating object integrity
+3. Testing restoration procedures
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime
+
+from drtest import aws_clients, metrics, tracing
+
+def get_md5(s3_client, bucket, key):
+    """Get MD5 hash of an S3 object"""
+    from botocore.exceptions import ClientError
+
+    try:
+        response = s3_client.head_object(Bucket=bucket, Key=key)
+        return response.get('ETag', '').strip('"')
+    except ClientError as e:
+        print(f"Error getting MD5 for {bucket}/{key}: {e}")
+        return None
+
+def check_object(s3_client, dest_bucket, obj):
+    """Check a source object listing entry against the destination bucket"""
+    from botocore.exceptions import ClientError
+
+    source_size = obj['Size']
+    source_md5 = obj['ETag'].strip('"')
+
+    # Check if object exists in destination
+    try:
+        dest_obj = s3_client.head_object(Bucket=dest_bucket, Key=obj['Key'])
+        dest_size = dest_obj['ContentLength']
+        dest_md5 = dest_obj['ETag'].strip('"')
+
+        if source_md5 == dest_md5 and source_size == dest_size:
+            return "MATCH"
+        return "MISMATCH"
+    except ClientError:
+        return "MISSING"
+
+def compare_objects(s3_client, source_bucket, dest_bucket, prefix='', max_workers=1):
+    """Compare objects between source and destination buckets"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    print(f"Comparing objects with prefix '{prefix}'...")
+    
+    results = {
+        'matching_objects': 0,
+        'missing_objects': 0,
+        'mismatched_objects': [],
+        'details': []
+    }
+    
+    # Get objects from source bucket
+    paginator = s3_client.get_paginator('list_objects_v2')
+    source_pages = paginator.paginate(Bucket=source_bucket, Prefix=prefix)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for page in source_pages:
+            if 'Contents' not in page:
+                continue
+
+            statuses = executor.map(lambda obj: check_object(s3_client, dest_bucket, obj), page['Contents'])
+
+            for obj, status in zip(page['Contents'], statuses):
+                source_key = obj['Key']
+
+                if status == "MATCH":
+                    results['matching_objects'] += 1
+                elif status == "MISMATCH":
+                    results['mismatched_objects'].append(source_key)
+                else:
+                    results['missing_objects'] += 1
+
+                results['details'].append({
+                    'key': source_key,
+                    'status': status
+                })
+    
+    return results
+
+def test_restore(s3_client, source_bucket, test_bucket, sample_keys):
+    """Test restoration of sample objects from source to test bucket"""
+    print(f"Testing restoration of {len(sample_keys)} sample objects...")
+    
+    results = {
+        'successful_restores': 0,
+        'failed_restores': 0,
+        'details': []
+    }
+    
+    for key in sample_keys:
+        try:
+            # Copy object from source to test bucket
+            s3_client.copy_object(
+                CopySource={'Bucket': source_bucket, 'Key': key},
+                Bucket=test_bucket,
+                Key=f"restore-test/{key}"
+            )
+            
+            # Verify the restored object
+            source_md5 = get_md5(s3_client, source_bucket, key)
+            restored_md5 = get_md5(s3_client, test_bucket, f"restore-test/{key}")
+            
+            if source_md5 == restored_md5:
+                results['successful_restores'] += 1
+                status = "SUCCESS"
+            else:
+                results['failed_restores'] += 1
+                status = "INTEGRITY_FAILURE"
+        except Exception as e:
+            results['failed_restores'] += 1
+            status = f"ERROR: {str(e)}"
+        
+        results['details'].append({
+            'key': key,
+            'status': status
+        })
+    
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='S3 Backup Validation Tool')
+    parser.add_argument('--source', required=True, help='Source S3 bucket name')
+    parser.add_argument('--destination', required=True, help='Destination S3 bucket name')
+    parser.add_argument('--test-bucket', help='Test bucket for restoration validation')
+    parser.add_argument('--prefix', default='', help='Object prefix to validate')
+    parser.add_argument('--sample-size', type=int, default=5, help='Number of sample objects to test restore')
+    parser.add_argument('--region', default='us-east-1', help='AWS region')
+    parser.add_argument('--workers', type=int, default=16, help='Concurrent HeadObject requests while comparing')
+    parser.add_argument('--report-file', default='s3-backup-validation-report.json', help='Report output file')
+    parser.add_argument('--publish-metrics', choices=('cloudwatch', 'emf'),
+                        help='Publish DRTest metrics to CloudWatch or as EMF log lines')
+    parser.add_argument('--emf-file', help='Append EMF log lines to this file instead of stderr')
+    
+    args = parser.parse_args(argv)
+
+    if args.publish_metrics:
+        metrics.configure(args.publish_metrics, region=args.region, emf_file=args.emf_file)
+    
+    # Initialize S3 client
+    s3_client = aws_clients.get_client('s3', region=args.region, max_workers=args.workers)
+    
+    # Start time
+    start_time = datetime.utcnow()
+    
+    # Compare buckets
+    with tracing.span('compare', source=args.source, destination=args.destination):
+        comparison_results = compare_objects(s3_client, args.source, args.destination, args.prefix, args.workers)
+    
+    # Test restoration if test bucket is provided
+    restore_results = None
+    if args.test_bucket:
+        with tracing.span('restore', test_bucket=args.test_bucket):
+            # Get sample keys for restore testing
+            paginator = s3_client.get_paginator('list_objects_v2')
+            pages = paginator.paginate(Bucket=args.source, Prefix=args.prefix, MaxItems=100)
+
+            sample_keys = []
+            for page in pages:
+                if 'Contents' in page:
+                    sample_keys.extend([obj['Key'] for obj in page['Contents']])
+                    if len(sample_keys) >= args.sample_size:
+                        break
+
+            sample_keys = sample_keys[:args.sample_size]
+            restore_results = test_restore(s3_client, args.source, args.test_bucket, sample_keys)
+    
+    # End time
+    end_time = datetime.utcnow()
+
+    objects_compared = comparison_results['matching_objects'] + len(comparison_results['mismatched_objects']) + comparison_results['missing_objects']
+    failures = comparison_results['missing_objects'] + len(comparison_results['mismatched_objects'])
+    if restore_results:
+        failures += restore_results['failed_restores']
+    status = 'PASSED' if objects_compared and failures == 0 else 'FAILED'
+    
+    # Generate report
+    report = {
+        'test_name': 'S3 Backup Validation',
+        'status': status,
+        'start_time': start_time.isoformat(),
+        'end_time': end_time.isoformat(),
+        'duration_seconds': (end_time - start_time).total_seconds(),
+        'source_bucket': args.source,
+        'destination_bucket': args.destination,
+        'prefix': args.prefix,
+        'comparison_results': comparison_results,
+        'restore_results': restore_results
+    }
+    
+    # Save report to file
+    with open(args.report_file, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    if objects_compared:
+        metrics.record('SuccessRate', (comparison_results['matching_objects'] / objects_compared) * 100,
+                       'Percent', {'TestId': 'latest', 'Test': 's3-backup'})
+    
+    # Print summary
+    print("\nValidation Summary:")
+    print(f"Source Bucket: {args.source}")
+    print(f"Destination Bucket: {args.destination}")
+    print(f"Objects compared: {objects_compared}")
+    print(f"Matching objects: {comparison_results['matching_objects']}")
+    print(f"Mismatched objects: {len(comparison_results['mismatched_objects'])}")
+    print(f"Missing objects: {comparison_results['missing_objects']}")
+    
+    if restore_results:
+        print(f"\nRestore Tests: {restore_results['successful_restores']} successful, {restore_results['failed_restores']} failed")
+    
+    print(f"\nValidation status: {status}")
+    print(f"Detailed report saved to: {args.report_file}")
+
+    return 0 if status == 'PASSED' else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""
+Small statistics helpers shared by the drtest tools.
+"""
+
+import math
+
+
+def percentile(values, pct):
+    """Return the pct percentile of values using linear interpolation"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return ordered[int(rank)]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
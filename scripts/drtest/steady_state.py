@@ -0,0 +1,527 @@
+"""
+FIS Steady-State Experiment Runner
+
+This script runs an AWS Fault Injection Simulator experiment while sampling
+steady-state probes in the background:
+1. HTTP endpoint latency and availability
+2. ELB TargetResponseTime
+3. ELB and HTTP error rates
+
+Samples are taken on a fixed schedule before, during and after the experiment
+and are summarised into a latency time series with degradation and recovery
+time calculations for the resilience test report.
+"""
+
+import argparse
+import json
+import math
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+from drtest import aws_clients, metrics
+from drtest.stats import percentile
+
+TERMINAL_STATES = ('completed', 'stopped', 'failed')
+
+
+class HttpProbe:
+    """Measures request latency and errors for an HTTP endpoint"""
+
+    kind = 'http'
+
+    def __init__(self, url, timeout=5.0, expected_status=200):
+        self.name = f"http:{url}"
+        self.url = url
+        self.timeout = timeout
+        self.expected_status = expected_status
+
+    def sample(self):
+        import urllib.error
+        import urllib.request
+
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(self.url, timeout=self.timeout) as response:
+                response.read()
+                status = response.status
+        except urllib.error.HTTPError as e:
+            status = e.code
+        except Exception as e:
+            return {
+                'latency_ms': (time.perf_counter() - started) * 1000,
+                'ok': False,
+                'error': str(e)
+            }
+
+        return {
+            'latency_ms': (time.perf_counter() - started) * 1000,
+            'ok': status == self.expected_status,
+            'status_code': status
+        }
+
+
+class ElbProbe:
+    """Reads recent ELB response time and error rate datapoints from CloudWatch"""
+
+    kind = 'elb'
+
+    def __init__(self, cloudwatch, load_balancer, period=60, lookback_seconds=300):
+        self.name = f"elb:{load_balancer}"
+        self.cloudwatch = cloudwatch
+        self.load_balancer = load_balancer
+        self.period = period
+        self.lookback_seconds = lookback_seconds
+
+    def _query(self, query_id, metric_name, stat):
+        return {
+            'Id': query_id,
+            'MetricStat': {
+                'Metric': {
+                    'Namespace': 'AWS/ApplicationELB',
+                    'MetricName': metric_name,
+                    'Dimensions': [{'Name': 'LoadBalancer', 'Value': self.load_balancer}]
+                },
+                'Period': self.period,
+                'Stat': stat
+            }
+        }
+
+    def sample(self):
+        end_time = datetime.utcnow()
+        response = self.cloudwatch.get_metric_data(
+            MetricDataQueries=[
+                self._query('latency', 'TargetResponseTime', 'Average'),
+                self._query('requests', 'RequestCount', 'Sum'),
+                self._query('errors', 'HTTPCode_Target_5XX_Count', 'Sum')
+            ],
+            StartTime=end_time - timedelta(seconds=self.lookback_seconds),
+            EndTime=end_time,
+            ScanBy='TimestampDescending'
+        )
+
+        series = {}
+        for result in response.get('MetricDataResults', []):
+            series[result['Id']] = dict(zip(result.get('Timestamps', []), result.get('Values', [])))
+
+        # Datapoints arrive minutes after their period ends and the newest
+        # ones are often partial (each ALB node reports late), so every poll
+        # returns the whole lookback and the sampler keeps the latest values
+        timestamps = sorted(series.get('latency', {}))
+        if not timestamps:
+            return None
+
+        samples = []
+        for timestamp in timestamps:
+            requests = series.get('requests', {}).get(timestamp, 0)
+            errors = series.get('errors', {}).get(timestamp, 0)
+            samples.append({
+                'latency_ms': series['latency'][timestamp] * 1000,
+                'ok': errors == 0,
+                'datapoint_time': timestamp.isoformat(),
+                'datapoint_epoch': timestamp.timestamp(),
+                'period_seconds': self.period,
+                'request_count': requests,
+                'error_count': errors,
+                'error_rate_percent': (errors / requests) * 100 if requests else 0
+            })
+        return samples
+
+
+def datapoint_phase(t, period, experiment_start, experiment_end):
+    """Phase of a CloudWatch datapoint covering [t, t + period) on the sampler clock"""
+    if t + period <= experiment_start:
+        return 'before'
+    if t >= experiment_end:
+        return 'after'
+    return 'during'
+
+
+def record_sample_metrics(sample):
+    if sample.get('latency_ms') is not None:
+        metrics.record('SteadyStateLatency', sample['latency_ms'], 'Milliseconds',
+                       {'Probe': sample['probe'], 'Phase': sample['phase']})
+    metrics.record('SteadyStateErrors', 0 if sample['ok'] else 1, 'Count',
+                   {'Probe': sample['probe'], 'Phase': sample['phase']})
+
+
+class SteadyStateSampler:
+    """Samples probes on a fixed-rate schedule without blocking the caller"""
+
+    def __init__(self, probes, intervals, max_workers=8):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.probes = probes
+        self.intervals = intervals
+        self.samples = []
+        self.phase = 'before'
+        self.origin = time.monotonic()
+        # Wall clock at the same instant, to place CloudWatch datapoints on the sampler clock
+        self.origin_epoch = time.time()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._threads = []
+        self._in_flight = {probe.name: 0 for probe in probes}
+        # (probe, datapoint time) -> index in samples, so re-read datapoints replace earlier values
+        self._datapoints = {}
+
+    def set_phase(self, phase):
+        with self._lock:
+            self.phase = phase
+
+    def mark(self):
+        """Return the sampler clock in seconds"""
+        return time.monotonic() - self.origin
+
+    def _run_probe(self, probe, scheduled_at, phase):
+        try:
+            result = probe.sample()
+        except Exception as e:
+            result = {'latency_ms': None, 'ok': False, 'error': str(e)}
+
+        results = result if isinstance(result, list) else [result] if result is not None else []
+        with self._lock:
+            self._in_flight[probe.name] -= 1
+            for result in results:
+                result.update({
+                    'probe': probe.name,
+                    'kind': probe.kind,
+                    'phase': phase,
+                    't': round(scheduled_at, 3),
+                    'wall_time': datetime.utcnow().isoformat()
+                })
+                if 'datapoint_epoch' in result:
+                    # Datapoints describe an earlier period than the poll; their
+                    # phase is assigned once the experiment boundaries are known
+                    result['t'] = round(result['datapoint_epoch'] - self.origin_epoch, 3)
+                    result['phase'] = None
+                    result['polled_at'] = round(scheduled_at, 3)
+                    key = (probe.name, result['datapoint_epoch'])
+                    if key in self._datapoints:
+                        index = self._datapoints[key]
+                        # Two polls can overlap; keep the values from the later one
+                        if self.samples[index]['polled_at'] <= result['polled_at']:
+                            self.samples[index] = result
+                        continue
+                    self._datapoints[key] = len(self.samples)
+                self.samples.append(result)
+
+        for result in results:
+            if result['phase'] is not None:
+                record_sample_metrics(result)
+
+    def poll_once(self, kind):
+        """Sample every probe of one kind right away, e.g. to collect late datapoints"""
+        for probe in self.probes:
+            if probe.kind == kind:
+                with self._lock:
+                    self._in_flight[probe.name] += 1
+                self._run_probe(probe, self.mark(), self.phase)
+
+    def _schedule(self, probe, interval):
+        next_tick = time.monotonic()
+        while not self._stop.is_set():
+            with self._lock:
+                phase = self.phase
+                # Skip a tick rather than queueing unbounded work when a probe
+                # is slower than its sampling interval
+                busy = self._in_flight[probe.name] >= 2
+                if not busy:
+                    self._in_flight[probe.name] += 1
+            if not busy:
+                self._executor.submit(self._run_probe, probe, next_tick - self.origin, phase)
+
+            # Advance on a fixed-rate grid so slow ticks do not cause drift
+            next_tick += interval
+            now = time.monotonic()
+            if next_tick < now:
+                next_tick += math.ceil((now - next_tick) / interval) * interval
+            self._stop.wait(next_tick - now)
+
+    def start(self):
+        for probe in self.probes:
+            thread = threading.Thread(
+                target=self._schedule,
+                args=(probe, self.intervals[probe.kind]),
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        self._executor.shutdown(wait=True)
+
+
+def summarize_phase(samples):
+    """Summarise latency and errors for a list of samples"""
+    latencies = [s['latency_ms'] for s in samples if s.get('latency_ms') is not None]
+    errors = sum(1 for s in samples if not s['ok'])
+
+    return {
+        'sample_count': len(samples),
+        'error_count': errors,
+        'error_rate_percent': (errors / len(samples)) * 100 if samples else 0,
+        'latency_ms': {
+            'mean': sum(latencies) / len(latencies) if latencies else None,
+            'p50': percentile(latencies, 50),
+            'p95': percentile(latencies, 95),
+            'p99': percentile(latencies, 99),
+            'max': max(latencies) if latencies else None
+        }
+    }
+
+
+def calculate_recovery_time(samples, experiment_end, baseline_p95, tolerance, window):
+    """Time from experiment end until `window` consecutive samples are healthy"""
+    threshold = baseline_p95 * (1 + tolerance) if baseline_p95 is not None else None
+    healthy_run = 0
+
+    for sample in samples:
+        if sample['t'] < experiment_end:
+            continue
+        latency = sample.get('latency_ms')
+        healthy = sample['ok'] and (threshold is None or (latency is not None and latency <= threshold))
+        healthy_run = healthy_run + 1 if healthy else 0
+        if healthy_run == 1:
+            recovered_at = sample['t']
+        if healthy_run >= window:
+            return max(0.0, recovered_at - experiment_end)
+
+    return None
+
+
+def analyze_probe(samples, experiment_start, experiment_end, tolerance, window):
+    """Build before/during/after statistics for one probe"""
+    for sample in samples:
+        if sample['phase'] is None:
+            sample['phase'] = datapoint_phase(sample['t'], sample['period_seconds'], experiment_start, experiment_end)
+            record_sample_metrics(sample)
+
+    phases = {
+        phase: summarize_phase([s for s in samples if s['phase'] == phase])
+        for phase in ('before', 'during', 'after')
+    }
+
+    baseline_p95 = phases['before']['latency_ms']['p95']
+    during_p95 = phases['during']['latency_ms']['p95']
+    degradation = None
+    if baseline_p95 and during_p95 is not None:
+        degradation = {
+            'p95_increase_ms': during_p95 - baseline_p95,
+            'p95_increase_percent': ((during_p95 - baseline_p95) / baseline_p95) * 100,
+            'error_rate_increase_percent': phases['during']['error_rate_percent'] - phases['before']['error_rate_percent']
+        }
+
+    return {
+        'phases': phases,
+        'degradation': degradation,
+        'recovery_time_seconds': calculate_recovery_time(
+            samples, experiment_end, baseline_p95, tolerance, window
+        ),
+        'time_series': [
+            {
+                't': round(s['t'] - experiment_start, 3),
+                'phase': s['phase'],
+                'latency_ms': s.get('latency_ms'),
+                'ok': s['ok']
+            }
+            for s in samples
+        ]
+    }
+
+
+def create_experiment_template(fis_client, sts_client, experiment_file, duration=None):
+    """Create an FIS experiment template from a JSON file, like run-fis-experiment.sh"""
+    with open(experiment_file, 'r') as f:
+        template = json.load(f)
+
+    account_id = sts_client.get_caller_identity()['Account']
+    template['roleArn'] = template['roleArn'].replace(':123456789012:', f":{account_id}:")
+
+    if duration:
+        for action in template.get('actions', {}).values():
+            parameters = action.get('parameters', {})
+            if 'durationSeconds' in parameters:
+                parameters['durationSeconds'] = str(duration)
+            elif 'duration' in parameters:
+                parameters['duration'] = f"PT{duration}S"
+
+    response = fis_client.create_experiment_template(**template)
+    return response['experimentTemplate']['id']
+
+
+def run_experiment(fis_client, template_id, sampler, poll_interval):
+    """Start an experiment and wait for it to reach a terminal state"""
+    response = fis_client.start_experiment(
+        experimentTemplateId=template_id,
+        tags={'Purpose': 'DR-Testing'}
+    )
+    experiment_id = response['experiment']['id']
+    print(f"Experiment started with ID: {experiment_id}")
+
+    state = response['experiment']['state']['status']
+    while state not in TERMINAL_STATES:
+        time.sleep(poll_interval)
+        experiment = fis_client.get_experiment(id=experiment_id)['experiment']
+        state = experiment['state']['status']
+        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Experiment status: {state} "
+              f"({len(sampler.samples)} samples)")
+
+    return experiment_id, state
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='FIS experiment runner with steady-state sampling')
+    parser.add_argument('--experiment', help='JSON experiment template file (e.g. network-latency.json)')
+    parser.add_argument('--template-id', help='Existing FIS experiment template ID')
+    parser.add_argument('--url', action='append', default=[], help='HTTP endpoint to probe (repeatable)')
+    parser.add_argument('--load-balancer', action='append', default=[],
+                        help='ALB dimension value, e.g. app/my-alb/0123456789abcdef (repeatable)')
+    parser.add_argument('--interval', type=float, default=1.0, help='HTTP sampling interval in seconds')
+    parser.add_argument('--elb-interval', type=float, default=10.0,
+                        help='CloudWatch polling interval in seconds (ALB metrics resolve to 60s)')
+    parser.add_argument('--baseline-seconds', type=int, default=60, help='Sampling time before the experiment')
+    parser.add_argument('--recovery-seconds', type=int, default=120,
+                        help='Sampling time after the experiment (ALB datapoints arrive 1-3 minutes late)')
+    parser.add_argument('--recovery-tolerance', type=float, default=0.2,
+                        help='Allowed p95 latency increase over baseline to count as recovered')
+    parser.add_argument('--recovery-window', type=int, default=5,
+                        help='Consecutive healthy HTTP samples required to count as recovered')
+    parser.add_argument('--elb-recovery-window', type=int, default=2,
+                        help='Consecutive healthy ELB datapoints (one per minute) required to count as recovered')
+    parser.add_argument('--duration', type=int, help='Override experiment duration in seconds')
+    parser.add_argument('--profile', default='dr-testing', help='AWS profile to use')
+    parser.add_argument('--region', default='us-east-1', help='AWS region')
+    parser.add_argument('--yes', action='store_true', help='Do not ask for confirmation')
+    parser.add_argument('--report-file', default='fis-steady-state-report.json', help='Report output file')
+    parser.add_argument('--publish-metrics', choices=('cloudwatch', 'emf'),
+                        help='Publish DRTest metrics to CloudWatch or as EMF log lines')
+    parser.add_argument('--emf-file', help='Append EMF log lines to this file instead of stderr')
+
+    args = parser.parse_args(argv)
+
+    if not args.experiment and not args.template_id:
+        parser.error('one of --experiment or --template-id is required')
+    if not args.url and not args.load_balancer:
+        parser.error('at least one --url or --load-balancer probe is required')
+    if args.recovery_window < 1:
+        parser.error('--recovery-window must be at least 1')
+    if args.elb_recovery_window < 1:
+        parser.error('--elb-recovery-window must be at least 1')
+
+    if args.publish_metrics:
+        metrics.configure(args.publish_metrics, profile=args.profile, region=args.region,
+                          emf_file=args.emf_file)
+
+    fis_client = aws_clients.get_client('fis', profile=args.profile, region=args.region)
+
+    template_id = args.template_id
+    if not template_id:
+        template_id = create_experiment_template(
+            fis_client,
+            aws_clients.get_client('sts', profile=args.profile, region=args.region),
+            args.experiment,
+            args.duration
+        )
+        print(f"Experiment template created: {template_id}")
+
+    if not args.yes:
+        print("\nCAUTION: This will inject faults into your AWS environment!")
+        confirmation = input("Do you want to proceed with the experiment? (yes/no): ")
+        if confirmation != 'yes':
+            print("Experiment cancelled. Template remains for review.")
+            return 0
+
+    probes = [HttpProbe(url) for url in args.url]
+    if args.load_balancer:
+        cloudwatch = aws_clients.get_client('cloudwatch', profile=args.profile, region=args.region)
+        probes += [ElbProbe(cloudwatch, lb) for lb in args.load_balancer]
+    sampler = SteadyStateSampler(probes, {'http': args.interval, 'elb': args.elb_interval})
+
+    start_time = datetime.utcnow()
+    sampler.start()
+
+    try:
+        print(f"Capturing {args.baseline_seconds}s steady-state baseline...")
+        time.sleep(args.baseline_seconds)
+
+        sampler.set_phase('during')
+        experiment_start = sampler.mark()
+        experiment_id, state = run_experiment(fis_client, template_id, sampler, poll_interval=5)
+        experiment_end = sampler.mark()
+
+        sampler.set_phase('after')
+        print(f"Experiment finished with status: {state}. Sampling recovery for {args.recovery_seconds}s...")
+        time.sleep(args.recovery_seconds)
+    finally:
+        sampler.stop()
+
+    # Pick up ELB datapoints published since the last scheduled poll
+    sampler.poll_once('elb')
+
+    end_time = datetime.utcnow()
+
+    probe_results = {}
+    for probe in probes:
+        samples = sorted((s for s in sampler.samples if s['probe'] == probe.name), key=lambda s: s['t'])
+        window = args.elb_recovery_window if probe.kind == 'elb' else args.recovery_window
+        probe_results[probe.name] = analyze_probe(
+            samples, experiment_start, experiment_end, args.recovery_tolerance, window
+        )
+
+    recovery_times = [result['recovery_time_seconds'] for result in probe_results.values()]
+    if recovery_times and None not in recovery_times:
+        metrics.record('RecoveryTime', max(recovery_times), 'Seconds', {'TestId': 'latest'})
+
+    report = {
+        'test_name': 'FIS Steady-State Experiment',
+        'start_time': start_time.isoformat(),
+        'end_time': end_time.isoformat(),
+        'duration_seconds': (end_time - start_time).total_seconds(),
+        'experiment_template_id': template_id,
+        'experiment_id': experiment_id,
+        'experiment_status': state,
+        'experiment_duration_seconds': experiment_end - experiment_start,
+        'sampling': {
+            'http_interval_seconds': args.interval,
+            'elb_interval_seconds': args.elb_interval,
+            'baseline_seconds': args.baseline_seconds,
+            'recovery_seconds': args.recovery_seconds,
+            'recovery_tolerance': args.recovery_tolerance,
+            'recovery_window': args.recovery_window,
+            'elb_recovery_window': args.elb_recovery_window
+        },
+        'probes': probe_results
+    }
+
+    with open(args.report_file, 'w') as f:
+        json.dump(report, f, indent=2, default=str)
+
+    print("\nSteady-State Summary:")
+    for name, result in probe_results.items():
+        phases = result['phases']
+        print(f"{name}:")
+        for phase in ('before', 'during', 'after'):
+            stats = phases[phase]
+            p95 = stats['latency_ms']['p95']
+            p95_text = f"{p95:.1f}ms" if p95 is not None else "n/a"
+            print(f"  {phase:<7} samples={stats['sample_count']:<5} p95={p95_text:<10} "
+                  f"errors={stats['error_rate_percent']:.1f}%")
+        recovery = result['recovery_time_seconds']
+        print(f"  Recovery time: {f'{recovery:.1f}s' if recovery is not None else 'not recovered'}")
+
+    print(f"\nDetailed report saved to: {args.report_file}")
+
+    if state == 'failed':
+        print("Experiment failed! Check results for details.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+Lightweight phase tracing for the DR test scripts.
+
+Scripts wrap their phases in `tracing.span(name)`; the AWS clients from
+drtest.aws_clients report every HTTP attempt and its payload sizes to the
+innermost open span. The stack of open spans is process-wide rather than
+per-thread so calls made from worker threads are attributed to the phase
+that started them.
+
+When DRTEST_TRACE_FILE is set (the DR validation suite runner sets it for
+each check) the finished trace is written there as JSON on exit.
+"""
+
+import atexit
+import contextlib
+import json
+import os
+import threading
+import time
+
+TRACE_FILE_ENV = 'DRTEST_TRACE_FILE'
+
+
+class Span:
+    """A named, timed phase with API call and byte counters"""
+
+    def __init__(self, name, **attributes):
+        self.name = name
+        self.attributes = attributes
+        self.start = time.time()
+        self.end = None
+        self.api_calls = {}
+        self.throttled_calls = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.children = []
+
+    def finish(self):
+        if self.end is None:
+            self.end = time.time()
+
+    def to_dict(self):
+        end = self.end if self.end is not None else time.time()
+        return {
+            'name': self.name,
+            'start': self.start,
+            'end': end,
+            'duration_seconds': round(end - self.start, 4),
+            'attributes': self.attributes,
+            'api_call_count': sum(self.api_calls.values()),
+            'api_calls': dict(sorted(self.api_calls.items())),
+            'throttled_calls': self.throttled_calls,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'children': [child.to_dict() for child in self.children]
+        }
+
+
+_lock = threading.Lock()
+_root = Span('process')
+_stack = [_root]
+
+
+@contextlib.contextmanager
+def span(name, **attributes):
+    """Trace a phase; API calls made while it is open are counted against it"""
+    child = Span(name, **attributes)
+    with _lock:
+        _stack[-1].children.append(child)
+        _stack.append(child)
+    try:
+        yield child
+    finally:
+        child.finish()
+        with _lock:
+            _stack.remove(child)
+
+
+def record_request(service, operation, bytes_sent=0):
+    """Count an HTTP attempt against the innermost open span"""
+    key = f"{service}.{operation}"
+    with _lock:
+        current = _stack[-1]
+        current.api_calls[key] = current.api_calls.get(key, 0) + 1
+        current.bytes_sent += bytes_sent
+
+
+def record_response(bytes_received=0, throttled=False):
+    """Count a response's payload against the innermost open span"""
+    with _lock:
+        current = _stack[-1]
+        current.bytes_received += bytes_received
+        if throttled:
+            current.throttled_calls += 1
+
+
+def trace():
+    """Return the trace collected so far"""
+    with _lock:
+        return _root.to_dict()
+
+
+def _write_trace_file():
+    path = os.environ.get(TRACE_FILE_ENV)
+    if not path:
+        return
+    _root.finish()
+    with open(path, 'w') as f:
+        json.dump(trace(), f, indent=2)
+
+
+atexit.register(_write_trace_file)
@@ -0,0 +1,384 @@
+"""
+DR Validation Suite Runner
+
+This script runs the DR validation checks described in an execution plan
+(see config/dr-validation-plan.json) by:
+1. Validating the dependency graph between checks
+2. Running every check whose dependencies have passed, in parallel, and
+   failing a check whose report records failed validation even when its
+   command exited 0
+3. Enforcing per-check timeouts, and refusing to start a check whose
+   input files are missing
+4. Collecting tracing spans (start, end, API calls, bytes) for each check
+   and the phases inside it into one combined report
+"""
+
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+
+from drtest import tracing
+from drtest.repo import REPO_ENV, find_repo_root
+
+# Report statuses that fail a check even when its command exited 0
+FAILED_REPORT_STATUSES = {'FAILED', 'FAILURE', 'ERROR', 'STOPPED', 'CANCELLED'}
+
+
+
+def load_plan(plan_file):
+    """Load an execution plan and check its dependency graph"""
+    with open(plan_file, 'r') as f:
+        plan = json.load(f)
+
+    checks = {}
+    for check in plan['checks']:
+        if check['id'] in checks:
+            raise ValueError(f"Duplicate check id: {check['id']}")
+        checks[check['id']] = check
+
+    for check in checks.values():
+        for dependency in check.get('depends_on', []):
+            if dependency not in checks:
+                raise ValueError(f"Check {check['id']} depends on unknown check {dependency}")
+
+    # Kahn's algorithm; anything left over is part of a cycle
+    remaining = {check_id: set(check.get('depends_on', [])) for check_id, check in checks.items()}
+    ready = [check_id for check_id, deps in remaining.items() if not deps]
+    ordered = []
+    while ready:
+        check_id = ready.pop()
+        ordered.append(check_id)
+        for other_id, deps in remaining.items():
+            if check_id in deps:
+                deps.discard(check_id)
+                if not deps and other_id not in ordered:
+                    ready.append(other_id)
+
+    if len(ordered) != len(checks):
+        cyclic = sorted(set(checks) - set(ordered))
+        raise ValueError(f"Dependency cycle between checks: {', '.join(cyclic)}")
+
+    return plan, checks
+
+
+def _expand(value, workdir, repo):
+    if repo is not None:
+        value = value.replace('{repo}', repo)
+    return value.replace('{workdir}', workdir)
+
+
+def _uses_repo(check):
+    values = check['command'] + check.get('inputs', []) + list(check.get('env', {}).values())
+    return any('{repo}' in value for value in values)
+
+
+def _run_command(command, workdir, env, timeout, log):
+    """Run a check's command; returns (status, exit code, error)"""
+    try:
+        # Reports are written to the working directory, so every check
+        # gets its own to keep parallel checks from overwriting each other
+        process = subprocess.Popen(
+            command, cwd=workdir, env=env, stdout=log, stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL, start_new_session=True
+        )
+    except OSError as e:
+        return 'FAILED', None, str(e)
+
+    try:
+        exit_code = process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        # Kill the whole process group so child aws CLI calls stop too
+        os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+        return 'TIMEOUT', None, f"Timed out after {timeout} seconds"
+    return ('PASSED' if exit_code == 0 else 'FAILED'), exit_code, None
+
+
+def check_report(report_file):
+    """Return why a check's report marks it failed, or None if it does not"""
+    from drtest.report_store import describe_report
+
+    if not os.path.exists(report_file):
+        return f"Exited 0 without writing its report {os.path.basename(report_file)}"
+    try:
+        with open(report_file, 'r') as f:
+            report = json.load(f)
+    except (OSError, ValueError) as e:
+        return f"Unreadable report {os.path.basename(report_file)}: {str(e)}"
+    if not isinstance(report, dict):
+        return f"Report {os.path.basename(report_file)} is not a JSON object"
+
+    # The scripts exit 0 when validation fails, so the report has the verdict
+    status = describe_report(report)['status']
+    if status is not None and str(status).upper() in FAILED_REPORT_STATUSES:
+        return f"Report status {status}"
+    return None
+
+
+def run_check(check, output_dir, default_timeout, repo=None):
+    """Run one check as a subprocess and return its span"""
+    check_id = check['id']
+    workdir = os.path.join(output_dir, check_id)
+    os.makedirs(workdir, exist_ok=True)
+    trace_file = os.path.join(workdir, 'trace.json')
+    timeout = check.get('timeout_seconds', default_timeout)
+
+    command = [_expand(part, workdir, repo) for part in check['command']]
+    env = dict(os.environ, **{key: _expand(value, workdir, repo) for key, value in check.get('env', {}).items()})
+    env[tracing.TRACE_FILE_ENV] = trace_file
+
+    report_file = os.path.join(workdir, check['report']) if check.get('report') else None
+    # The working directory is reused across runs of the same output
+    # directory, so results left by an earlier run must not be read as this one's
+    for path in (report_file, trace_file):
+        if path and os.path.exists(path):
+            os.remove(path)
+
+    start = time.time()
+    status = 'FAILED'
+    exit_code = None
+
+    # Scripts that cannot find their config write a sample one and exit 0,
+    # so a missing input must stop the check before it runs
+    missing = [path for path in (_expand(part, workdir, repo) for part in check.get('inputs', []))
+               if not os.path.exists(path)]
+
+    with open(os.path.join(workdir, 'output.log'), 'w') as log:
+        if missing:
+            error = f"Missing input files: {', '.join(missing)}"
+            log.write(error + '\n')
+        else:
+            status, exit_code, error = _run_command(command, workdir, env, timeout, log)
+
+    if status == 'PASSED' and report_file:
+        error = check_report(report_file)
+        if error:
+            status = 'FAILED'
+
+    end = time.time()
+
+    span = {
+        'name': check_id,
+        'description': check.get('description', ''),
+        'status': status,
+        'exit_code': exit_code,
+        'error': error,
+        'start': start,
+        'end': end,
+        'duration_seconds': round(end - start, 4),
+        'timeout_seconds': timeout,
+        'depends_on': check.get('depends_on', []),
+        'log_file': os.path.join(workdir, 'output.log'),
+        'report_file': report_file,
+        # Shell checks call the AWS CLI directly and are not traced
+        'api_call_count': None,
+        'api_calls': {},
+        'throttled_calls': None,
+        'bytes_sent': None,
+        'bytes_received': None,
+        'children': []
+    }
+
+    if os.path.exists(trace_file):
+        # A check killed while writing its trace leaves a truncated file;
+        # that fails this check rather than the whole suite
+        try:
+            with open(trace_file, 'r') as f:
+                trace = json.load(f)
+            span.update({
+                'api_call_count': _total(trace, 'api_call_count'),
+                'api_calls': _merge_calls(trace),
+                'throttled_calls': _total(trace, 'throttled_calls'),
+                'bytes_sent': _total(trace, 'bytes_sent'),
+                'bytes_received': _total(trace, 'bytes_received'),
+                'children': trace['children']
+            })
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            span['status'] = 'FAILED'
+            span['error'] = f"Unreadable trace file {trace_file}: {str(e)}"
+            return span
+        # Calls made outside any phase are kept as their own child span
+        if trace['api_call_count']:
+            span['children'].append(dict(trace, name='unscoped', children=[]))
+
+    return span
+
+
+def _total(span, field):
+    return span[field] + sum(_total(child, field) for child in span['children'])
+
+
+def _merge_calls(span, merged=None):
+    merged = {} if merged is None else merged
+    for key, count in span['api_calls'].items():
+        merged[key] = merged.get(key, 0) + count
+    for child in span['children']:
+        _merge_calls(child, merged)
+    return dict(sorted(merged.items()))
+
+
+def run_plan(plan, checks, output_dir, max_parallel, repo=None):
+    """Run checks as soon as their dependencies pass; returns spans by check id"""
+    default_timeout = plan.get('default_timeout_seconds', 1800)
+    spans = {}
+    pending = dict(checks)
+
+    def skip_blocked():
+        # A check whose dependency did not pass is skipped, and so is
+        # everything downstream of it
+        changed = True
+        while changed:
+            changed = False
+            for check_id, check in list(pending.items()):
+                failed = [dep for dep in check.get('depends_on', [])
+                          if dep in spans and spans[dep]['status'] != 'PASSED']
+                if failed:
+                    now = time.time()
+                    spans[check_id] = {
+                        'name': check_id, 'status': 'SKIPPED', 'start': now, 'end': now,
+                        'duration_seconds': 0, 'depends_on': check.get('depends_on', []),
+                        'error': f"Dependency did not pass: {', '.join(failed)}", 'children': []
+                    }
+                    del pending[check_id]
+                    changed = True
+
+    def ready_checks():
+        return [check for check in pending.values()
+                if all(spans.get(dep, {}).get('status') == 'PASSED' for dep in check.get('depends_on', []))]
+
+    with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+        running = {}
+        while pending or running:
+            skip_blocked()
+            for check in ready_checks():
+                print(f"[{datetime.now().strftime('%H:%M:%S')}] Starting {check['id']}")
+                running[executor.submit(run_check, check, output_dir, default_timeout, repo)] = check['id']
+                del pending[check['id']]
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                check_id = running.pop(future)
+                spans[check_id] = future.result()
+                print(f"[{datetime.now().strftime('%H:%M:%S')}] {check_id}: {spans[check_id]['status']} "
+                      f"({spans[check_id]['duration_seconds']:.1f}s)")
+
+    return spans
+
+
+def critical_path(checks, spans):
+    """Longest chain of dependent checks by duration"""
+    memo = {}
+
+    def longest(check_id):
+        if check_id not in memo:
+            deps = checks[check_id].get('depends_on', [])
+            best = max((longest(dep) for dep in deps), key=lambda path: path[0], default=(0, []))
+            memo[check_id] = (best[0] + spans[check_id]['duration_seconds'], best[1] + [check_id])
+        return memo[check_id]
+
+    return max((longest(check_id) for check_id in checks), key=lambda path: path[0], default=(0, []))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='DR validation suite runner')
+    parser.add_argument('--plan', help='Execution plan JSON file (default: config/dr-validation-plan.json '
+                                       'in the repository)')
+    parser.add_argument('--repo', help=f"Repository checkout substituted for {{repo}} in the plan (default: "
+                                       f"${REPO_ENV}, the current directory or a parent of it)")
+    parser.add_argument('--only', action='append', default=[],
+                        help='Run only this check and its dependencies (repeatable)')
+    parser.add_argument('--max-parallel', type=int, help='Override the plan\'s max_parallel')
+    parser.add_argument('--output-dir', default=f"dr-validation-{datetime.now().strftime('%Y%m%d-%H%M%S')}",
+                        help='Directory for per-check logs and reports')
+    parser.add_argument('--report-file', default='dr-validation-report.json', help='Combined report output file')
+
+    args = parser.parse_args(argv)
+
+    repo = os.path.abspath(args.repo) if args.repo else find_repo_root()
+    if args.plan is None:
+        if repo is None:
+            parser.error(f"--plan is required outside a DR-Test-Environment checkout (or set --repo or ${REPO_ENV})")
+        args.plan = os.path.join(repo, 'config', 'dr-validation-plan.json')
+
+    plan, checks = load_plan(args.plan)
+
+    if args.only:
+        selected = set()
+        stack = list(args.only)
+        while stack:
+            check_id = stack.pop()
+            if check_id not in checks:
+                parser.error(f"unknown check: {check_id}")
+            if check_id not in selected:
+                selected.add(check_id)
+                stack.extend(checks[check_id].get('depends_on', []))
+        checks = {check_id: check for check_id, check in checks.items() if check_id in selected}
+
+    if repo is None and any(_uses_repo(check) for check in checks.values()):
+        parser.error(f"the plan refers to {{repo}} but no DR-Test-Environment checkout was found "
+                     f"(set --repo or ${REPO_ENV})")
+
+    max_parallel = args.max_parallel or plan.get('max_parallel', 4)
+    output_dir = os.path.abspath(args.output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+
+    print(f"Running plan '{plan['name']}': {len(checks)} checks, up to {max_parallel} in parallel")
+
+    start_time = datetime.utcnow()
+    started = time.time()
+    spans = run_plan(plan, checks, output_dir, max_parallel, repo)
+    wall_time = time.time() - started
+    end_time = datetime.utcnow()
+
+    serial_time = sum(span['duration_seconds'] for span in spans.values())
+    path_seconds, path = critical_path(checks, spans)
+    counts = {}
+    for span in spans.values():
+        counts[span['status']] = counts.get(span['status'], 0) + 1
+
+    report = {
+        'test_name': 'DR Validation Suite',
+        'plan': plan['name'],
+        'start_time': start_time.isoformat(),
+        'end_time': end_time.isoformat(),
+        'duration_seconds': round(wall_time, 4),
+        'summary': {
+            'total_checks': len(spans),
+            'status_counts': counts,
+            'serial_duration_seconds': round(serial_time, 4),
+            'parallel_speedup': round(serial_time / wall_time, 2) if wall_time else None,
+            'critical_path': path,
+            'critical_path_seconds': round(path_seconds, 4),
+            'api_call_count': sum(span.get('api_call_count') or 0 for span in spans.values()),
+            'bytes_sent': sum(span.get('bytes_sent') or 0 for span in spans.values()),
+            'bytes_received': sum(span.get('bytes_received') or 0 for span in spans.values())
+        },
+        'spans': sorted(spans.values(), key=lambda span: span['start'])
+    }
+
+    with open(args.report_file, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print("\nDR Validation Summary:")
+    for span in report['spans']:
+        api_calls = span.get('api_call_count')
+        api_text = f"{api_calls} API calls" if api_calls is not None else "untraced"
+        print(f"{span['name']:<20} {span['status']:<8} {span['duration_seconds']:>9.1f}s  {api_text}")
+    print(f"\nWall time: {wall_time:.1f}s (serial {serial_time:.1f}s, "
+          f"critical path {' -> '.join(path)} {path_seconds:.1f}s)")
+    print(f"Detailed report saved to: {args.report_file}")
+
+    return 1 if any(span['status'] != 'PASSED' for span in spans.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+FIS Steady-State Experiment Runner
+
+Wrapper kept for existing runbooks; the implementation lives in
+scripts/drtest/steady_state.py and is also available as `drtest fis-steady-state`.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from drtest.steady_state import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+DR Validation Suite Runner
+
+Wrapper kept for existing runbooks; the implementation lives in
+scripts/drtest/validation_suite.py and is also available as `drtest validate`.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from drtest.validation_suite import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+Historical Report Store
+
+Wrapper kept for existing runbooks; the implementation lives in
+scripts/drtest/report_cli.py and is also available as `drtest report-store`.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from drtest.report_cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())